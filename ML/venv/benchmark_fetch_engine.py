@@ -0,0 +1,52 @@
+# benchmark_fetch_engine.py
+import contextlib
+import io
+import time
+from goviral_api import InstagramVerificationSystem
+from insta_stub_server import StubInstagramServer
+
+TOKEN = 'GV-123456'
+
+# Each scenario configures the stub the way Instagram commonly behaves
+SCENARIOS = {
+    'login wall, JSON endpoint works': {
+        'delays': {'desktop': 1.0, 'mobile': 1.0, 'json': 0.3},
+        'hide_bio': {'desktop', 'mobile'},
+    },
+    'desktop blocked, mobile page works': {
+        'delays': {'desktop': 1.5, 'mobile': 0.5, 'json': 1.0},
+        'statuses': {'desktop': 429},
+    },
+    'everything slow and empty': {
+        'delays': {'desktop': 2.0, 'mobile': 2.0, 'json': 2.0},
+        'hide_bio': {'desktop', 'mobile', 'json'},
+    },
+}
+
+def timed(extract, username):
+    """Run one extraction quietly and return (token, seconds)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        token = extract(username)
+    return token, time.perf_counter() - start
+
+def main(fetch_deadline=5.0):
+    """Compare sequential and concurrent token extraction against the stub"""
+    print("⏱️  Instagram fetch engine benchmark (local stub server)")
+    print("=" * 60)
+
+    for name, config in SCENARIOS.items():
+        with StubInstagramServer(bios={'nasa': f'Exploring the universe {TOKEN}'}, **config) as server:
+            verifier = InstagramVerificationSystem(base_url=server.base_url, fetch_deadline=fetch_deadline)
+            try:
+                seq_token, seq_time = timed(verifier.extract_verification_token_sequential, 'nasa')
+                con_token, con_time = timed(verifier.extract_verification_token, 'nasa')
+            finally:
+                verifier.fetch_engine.close()
+
+        print(f"\n🧪 {name}:")
+        print(f"   Sequential: {seq_time:>6.2f}s  token={seq_token}")
+        print(f"   Concurrent: {con_time:>6.2f}s  token={con_token}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmark_model_loading.py
+import json
+import subprocess
+import sys
+
+# Each mode runs in a fresh interpreter so import and page-cache costs are counted
+LOADERS = {
+    'pickle': """
+import pickle
+with open('goviral_trained_model.pkl', 'rb') as f:
+    model_data = pickle.load(f)
+model, scaler = model_data['model'], model_data['scaler']
+""",
+    'compiled': """
+from goviral_tree_engine import CompiledForest
+model = CompiledForest()
+scaler = model.load_scaler()
+""",
+}
+
+MEASURE = """
+import time
+start = time.perf_counter()
+{loader}
+load_time = time.perf_counter() - start
+
+import json, os, resource
+import numpy as np
+
+sample = np.array([[45000, 50000, 2200, 80, 55000, 11]], dtype=float)
+start = time.perf_counter()
+model.predict(scaler.transform(sample))
+first_predict = time.perf_counter() - start
+
+def pss_kb():
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+
+# Forked workers that each predict, like gunicorn preloading the app
+worker_pss = []
+if hasattr(os, 'fork') and pss_kb() is not None:
+    for _ in range({workers}):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            model.predict(scaler.transform(sample))
+            os.write(write_fd, str(pss_kb()).encode())
+            os._exit(0)
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        worker_pss.append(int(os.read(read_fd, 64)))
+        os.close(read_fd)
+
+print(json.dumps({{
+    'load_time': load_time,
+    'first_predict': first_predict,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'worker_pss_mb': [kb / 1024 for kb in worker_pss],
+}}))
+"""
+
+def run_mode(mode, workers=4):
+    """Run one loader in a subprocess and return its measurements"""
+    code = MEASURE.format(loader=LOADERS[mode], workers=workers)
+    output = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', code],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main(repeats=3, workers=4):
+    """Compare startup time and memory of the pickle and compiled model paths"""
+    print("⏱️  GoViral model loading benchmark")
+    print("=" * 60)
+
+    for mode in LOADERS:
+        runs = [run_mode(mode, workers) for _ in range(repeats)]
+        best = min(runs, key=lambda run: run['load_time'])
+
+        print(f"\n📦 {mode}:")
+        print(f"   Load time (best of {repeats}): {best['load_time'] * 1000:>8.1f} ms")
+        print(f"   First prediction:        {best['first_predict'] * 1000:>8.1f} ms")
+        print(f"   Max RSS:                 {best['max_rss_mb']:>8.1f} MB")
+        if best['worker_pss_mb']:
+            print(f"   PSS of {workers} forked workers: {sum(best['worker_pss_mb']):>8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# benchmark_profile_extractor.py
+import glob
+import json
+import os
+import re
+import timeit
+from insta_profile_extractor import extract_profile, find_token_in_html
+
+FIXTURE_PATTERN = 'debug_*.html'
+
+# Profile block of the kind Instagram serves, injected into each fixture
+PROFILE_HEAD = (
+    '<meta property="og:description" content="12.5K Followers, 310 Following, 842 Posts - '
+    'See Instagram photos and videos from Stub Account (@stub_account)">'
+    '<meta name="description" content="Exploring the universe | GV-123456">'
+)
+
+def legacy_find_token(text):
+    """Token search as it was before the single-pass extractor"""
+    if not text:
+        return None
+    for pattern in [r'GV-\d{6}', r'VERIFY-\d{6}', r'CODE-\d{6}', r'AUTH-\d{6}',
+                    r'TOKEN-\d{6}', r'[A-Z]{2,4}-\d{4,8}']:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            return matches[0].upper()
+    return None
+
+def legacy_parse(html):
+    """The previous four-parser chain: each parser rescans the whole page"""
+    match = re.search(r'window\._sharedData\s*=\s*({.+?})\s*;\s*</script>', html, re.DOTALL)
+    if match:
+        try:
+            data = json.loads(match.group(1))
+            user = data.get('entry_data', {}).get('ProfilePage', [{}])[0].get('graphql', {}).get('user', {})
+            token = legacy_find_token(user.get('biography', ''))
+            if token:
+                return token
+        except Exception:
+            pass
+
+    for block in re.findall(r'<script type="application/ld\+json">\s*({.+?})\s*</script>', html, re.DOTALL):
+        try:
+            data = json.loads(block)
+            token = legacy_find_token(data.get('description', '') or data.get('articleBody', ''))
+            if token:
+                return token
+        except Exception:
+            continue
+
+    for pattern in [r'<meta[^>]*name="description"[^>]*content="([^"]*)"',
+                    r'<meta[^>]*property="og:description"[^>]*content="([^"]*)"']:
+        for description in re.findall(pattern, html):
+            token = legacy_find_token(description)
+            if token:
+                return token
+
+    clean_html = re.sub(r'<script.*?</script>', '', html, flags=re.DOTALL)
+    clean_html = re.sub(r'<style.*?</style>', '', clean_html, flags=re.DOTALL)
+    text = re.sub(r'<[^>]+>', ' ', clean_html)
+    text = ' '.join(text.split())
+    return legacy_find_token(text)
+
+# Pages where the first token-shaped string is not the verification token
+PRIORITY_CASES = {
+    'generic before GV in text': '<html><body><p>Est. COVID-2019 survivor | GV-123456</p></body></html>',
+    'longer generic before GV': '<html><body><p>AB-12345678 GV-123456</p></body></html>',
+    'title before meta': ('<html><head><title>ISO-9001 certified</title>'
+                          '<meta name="description" content="Quality first | GV-123456"></head></html>'),
+    'meta before text': ('<html><head><meta name="description" content="Code AB-1234">'
+                         '</head><body><p>GV-654321</p></body></html>'),
+    '_sharedData after text': ('<html><body><p>XY-98765</p><script>window._sharedData = '
+                               '{"entry_data": {"ProfilePage": [{"graphql": {"user": '
+                               '{"biography": "bio QR-4321"}}}]}};</script></body></html>'),
+}
+
+def check_priority():
+    """Extractor and legacy chain must agree on which token a page carries"""
+    mismatches = 0
+    for name, page in PRIORITY_CASES.items():
+        legacy_token = legacy_parse(page)
+        for label, token in (('token', find_token_in_html(page)), ('profile', extract_profile(page)['token'])):
+            if token != legacy_token:
+                mismatches += 1
+                print(f"⚠️  {name}: {label} mismatch (legacy={legacy_token}, new={token})")
+    print(f"🎯 Token priority: {len(PRIORITY_CASES) - mismatches}/{len(PRIORITY_CASES)} cases match the legacy chain"
+          if not mismatches else f"❌ Token priority: {mismatches} mismatches")
+    return mismatches == 0
+
+def load_fixtures():
+    """Checked-in debug pages, as-is and with a profile block in the <head>
+
+    The debug pages are the raw bodies try_direct_scrape saved while it
+    still asked for brotli without being able to decode it, so on their own
+    they are the worst case: no token anywhere and every parser runs.
+    """
+    fixtures = {}
+    for path in sorted(glob.glob(FIXTURE_PATTERN)):
+        name = os.path.basename(path)[len('debug_'):-len('.html')]
+        with open(path, encoding='utf-8') as f:
+            page = f.read()
+        fixtures[f'{name} (no token)'] = page
+        fixtures[f'{name} (profile in head)'] = f'<html><head>{PROFILE_HEAD}</head><body>{page}</body></html>'
+    return fixtures
+
+def bench(func, page, number):
+    return min(timeit.repeat(lambda: func(page), number=number, repeat=5)) / number
+
+def main(number=20):
+    """Time the legacy parser chain against the single-pass extractor per fixture"""
+    print("⏱️  Profile extraction micro-benchmark")
+    print("=" * 81)
+    check_priority()
+    print(f"{'fixture':<42}{'legacy':>10}{'token':>10}{'profile':>10}{'speedup':>9}")
+
+    for name, page in load_fixtures().items():
+        legacy_token = legacy_parse(page)
+        token = find_token_in_html(page)
+        if token != legacy_token:
+            print(f"⚠️  {name}: token mismatch (legacy={legacy_token}, new={token})")
+
+        legacy_time = bench(legacy_parse, page, number)
+        token_time = bench(find_token_in_html, page, number)
+        profile_time = bench(extract_profile, page, number)
+
+        print(f"{name:<42}{legacy_time * 1000:>8.2f}ms{token_time * 1000:>8.2f}ms"
+              f"{profile_time * 1000:>8.2f}ms{legacy_time / token_time:>8.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# benchmark_scrape_pool.py
+import json
+import os
+import tempfile
+import threading
+import time
+import requests
+from insta_profile_extractor import extract_profile
+from insta_scrape_pool import HostRateLimiter, PooledScraper, ResultStream
+from insta_stub_server import StubInstagramServer
+
+# Real-world timings scaled down so the whole run takes seconds
+SCALE = 0.05
+LEGACY_PAGE_WAIT = 5 * SCALE     # time.sleep(5) after driver.get
+LEGACY_URL_SLEEP = 3 * SCALE     # time.sleep(3) after every URL
+MIN_INTERVAL = 2 * SCALE         # pooled per-host spacing
+BROWSER_STARTUP = 2 * SCALE      # launching one headless Chrome
+
+MOBILE_UA = 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148'
+
+class FakeBrowser:
+    """Stands in for InstagramSeleniumScraper against the stub server
+
+    Loads pages with a mobile User-Agent, which the stub serves with counts
+    even when the desktop page is behind the simulated login wall, the way
+    a rendered page gets data a plain request does not.
+    """
+    started = 0
+
+    def __init__(self, page_wait=0.0):
+        time.sleep(BROWSER_STARTUP)
+        FakeBrowser.started += 1
+        self.page_wait = page_wait
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = MOBILE_UA
+
+    def get_follower_count_public(self, url):
+        response = self.session.get(url, timeout=10)
+        time.sleep(self.page_wait)
+        if response.status_code != 200:
+            return None
+        return extract_profile(response.text)['follower_count']
+
+    def close(self):
+        self.session.close()
+
+class RecordingRateLimiter(HostRateLimiter):
+    """HostRateLimiter that remembers when each request was let through"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.released = []
+
+    def acquire(self, url):
+        waited = super().acquire(url)
+        self.released.append(time.monotonic())
+        return waited
+
+def smallest_gap(times):
+    times = sorted(times)
+    return min((b - a for a, b in zip(times, times[1:])), default=0)
+
+def build_roster(n=120):
+    followers = {f'creator{i:04d}': 1_000 + i * 137 for i in range(n)}
+    walled = {f'creator{i:04d}' for i in range(0, n, 4)}        # need the browser
+    throttled = {f'creator{i:04d}': 1 for i in range(3, n, 20)}  # one 429 each
+    return followers, walled, throttled
+
+def legacy_run(base_url, usernames):
+    """The old get_multiple_followers loop: one browser, fixed sleeps"""
+    browser = FakeBrowser(page_wait=LEGACY_PAGE_WAIT)
+    results = {}
+    for username in usernames:
+        results[username] = browser.get_follower_count_public(f"{base_url}/{username}/")
+        time.sleep(LEGACY_URL_SLEEP)
+    return results
+
+def check_results(path, expected):
+    records = {}
+    duplicates = 0
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record['followers'] is not None:
+                duplicates += record['username'] in records
+                records[record['username']] = record['followers']
+    wrong = sum(1 for user, count in expected.items() if records.get(user) != count)
+    return len(records), wrong, duplicates
+
+def main(workers=4):
+    print("⏱️  Pooled scraper benchmark (local stub server, fake browser)")
+    print("=" * 60)
+
+    followers, walled, throttled = build_roster()
+    usernames = sorted(followers)
+
+    with StubInstagramServer(followers=followers, delays={'desktop': 0.05, 'mobile': 0.05}) as server:
+        # Legacy loop on a slice; every page needs the browser and the fixed sleeps
+        sample = usernames[:20]
+        start = time.perf_counter()
+        legacy = legacy_run(server.base_url, sample)
+        legacy_rate = len(sample) / (time.perf_counter() - start)
+        print(f"\n🐢 Legacy loop: {legacy_rate:.1f} profiles/s "
+              f"({sum(v is not None for v in legacy.values())}/{len(sample)} found)")
+
+    with StubInstagramServer(followers=followers, throttle=throttled, login_wall=walled,
+                             delays={'desktop': 0.05, 'mobile': 0.05}) as server:
+        urls = [f"{server.base_url}/{username}/" for username in usernames]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'follower_counts.jsonl')
+            FakeBrowser.started = 0
+
+            # Interrupted run: stop after a third of the roster
+            limiter = RecordingRateLimiter(min_interval=MIN_INTERVAL, backoff_base=0.2)
+            scraper = PooledScraper(workers=workers, browser_factory=FakeBrowser, rate_limiter=limiter)
+            stopper = threading.Timer(len(urls) * MIN_INTERVAL / 3, scraper.stop)
+            stopper.start()
+            first = scraper.run(urls, output, progress_every=0)
+            stopper.cancel()
+            released_gap = smallest_gap(limiter.released)
+
+            # Simulate a kill in the middle of writing a record
+            with open(output, 'a', encoding='utf-8') as f:
+                f.write('{"url": "' + urls[-1] + '", "follow')
+
+            resumed = PooledScraper(workers=workers, browser_factory=FakeBrowser,
+                                    rate_limiter=HostRateLimiter(min_interval=MIN_INTERVAL, backoff_base=0.2))
+            second = resumed.run(urls, output, progress_every=0)
+
+            found, wrong, duplicates = check_results(output, followers)
+            total_time = first['elapsed'] + second['elapsed']
+
+            print(f"\n🚀 Pooled ({workers} workers, {MIN_INTERVAL:.2f}s per-host interval):")
+            print(f"   First run stopped after {first['scraped']} profiles; resume skipped {second['skipped']}")
+            print(f"   {len(urls) / total_time:.1f} profiles/s overall, "
+                  f"{first['http'] + second['http']} via HTTP, {first['browser'] + second['browser']} via browser, "
+                  f"{FakeBrowser.started} browsers started")
+            print(f"   Results: {found}/{len(followers)} found, {wrong} wrong, {duplicates} duplicated")
+            # Measured after each thread wakes, so a few ms of scheduling jitter shows up here
+            print(f"   Smallest gap between requests let through: {released_gap:.3f}s (limit {MIN_INTERVAL:.3f}s)")
+            print(f"   Resume keys after truncated line: {len(ResultStream.completed(output))}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# benchmark_verification_jobs.py
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from multiprocessing import Pool
+from verification_jobs import (InMemoryVerificationStore, SQLiteVerificationStore, VerificationJobManager,
+                               VerificationStore)
+
+SCRAPE_SECONDS = 0.4
+
+class FakeVerifier:
+    """Stands in for InstagramVerificationSystem; the bio holds whatever `bios` says"""
+
+    def __init__(self, delay=SCRAPE_SECONDS):
+        self.delay = delay
+        self.bios = {}
+        self.scrapes = Counter()
+        self._tokens = iter(f'GV-{n}' for n in range(100000, 999999))
+        self._lock = threading.Lock()
+
+    def clean_username(self, username):
+        return username.strip().lstrip('@').lower()
+
+    def generate_verification_token(self):
+        with self._lock:
+            return next(self._tokens)
+
+    def verify_user(self, username, expected_token):
+        with self._lock:
+            self.scrapes[username] += 1
+        time.sleep(self.delay)
+        return self.build_verification_result(username, expected_token, self.bios.get(username), self.delay)
+
+    def build_verification_result(self, username, expected_token, found_token, verification_time, cached=False):
+        return {'verified': found_token == expected_token, 'username': username, 'expected_token': expected_token,
+                'found_token': found_token, 'verification_time': verification_time, 'cached': cached}
+
+def new_job(username, token, status='queued', age=0.0):
+    now = time.time() - age
+    return {'job_id': uuid.uuid4().hex, 'username': username, 'verification_token': token,
+            'status': status, 'result': None, 'created_at': now, 'updated_at': now}
+
+def check(name, ok, detail=''):
+    print(f"   {'✅' if ok else '❌'} {name}{f' ({detail})' if detail else ''}")
+    return ok
+
+def check_queued_jobs_survive(store):
+    """A job waiting behind a busy worker is neither abandoned nor duplicated"""
+    verifier = FakeVerifier()
+    manager = VerificationJobManager(verifier, store, max_workers=1, job_lease=0.3)
+    try:
+        tokens = {user: manager.start_verification(user) for user in ('alice', 'bob')}
+        verifier.bios.update(tokens)
+        manager.submit('alice', tokens['alice'])
+        queued = manager.submit('bob', tokens['bob'])
+
+        time.sleep(SCRAPE_SECONDS * 0.75)  # well past the lease, bob still queued
+        polled = manager.get_job(queued['job_id'])
+        again = manager.submit('bob', tokens['bob'])
+        done = manager.wait(queued, timeout=5)
+    finally:
+        manager.close()
+
+    return all([
+        check('queued job not reported abandoned', polled['status'] == 'queued', polled['status']),
+        check('second check joins the queued job', again['job_id'] == queued['job_id']),
+        check('each profile scraped once', verifier.scrapes == Counter(alice=1, bob=1), dict(verifier.scrapes)),
+        check('queued job verifies', done['result'] and done['result']['verified']),
+    ])
+
+def check_new_token_gets_new_job(store):
+    """A check with a freshly issued token never joins one for an older token"""
+    verifier = FakeVerifier()
+    manager = VerificationJobManager(verifier, store, max_workers=2)
+    try:
+        first = manager.start_verification('carol')
+        old_job = manager.submit('carol', first)
+        second = manager.start_verification('carol')
+        verifier.bios['carol'] = second
+        new = manager.submit('carol', second)
+        result = manager.wait(new, timeout=5)['result']
+        manager.wait(old_job, timeout=5)
+    finally:
+        manager.close()
+
+    return all([
+        check('new token starts its own job', new['job_id'] != old_job['job_id']),
+        check('new job checks the new token', result['verified'] and result['expected_token'] == second,
+              result['expected_token']),
+    ])
+
+def check_abandoned_jobs(store):
+    """Jobs left active by a dead worker fail and stop blocking new checks"""
+    verifier = FakeVerifier(delay=0.05)
+    manager = VerificationJobManager(verifier, store, job_lease=1.0)
+    try:
+        token = manager.start_verification('dave')
+        verifier.bios['dave'] = token
+        orphan = new_job('dave', token, status='running', age=5)
+        store.save_job(orphan)
+        reported = manager.get_job(orphan['job_id'])
+        job = manager.submit('dave', token)
+        result = manager.wait(job, timeout=5)['result']
+
+        stale_queued = new_job('erin', 'GV-000001', age=5)
+        store.save_job(stale_queued)
+        store.purge_expired(job_ttl=3600, lease=1.0)
+        purged = store.get_job(stale_queued['job_id'])
+    finally:
+        manager.close()
+
+    return all([
+        check('orphaned job reported failed', reported['status'] == 'failed', reported['status']),
+        check('new check replaces the orphaned job', job['job_id'] != orphan['job_id'] and result['verified']),
+        check('purge fails orphaned queued job', purged['status'] == 'failed', purged['status']),
+    ])
+
+def check_cache_and_ttl(store):
+    """Found tokens expire, the cache keeps its most recently used entries, old jobs are purged"""
+    store.cache_found_token('expired', 'GV-111111', time.time() - 1)
+    for i in range(store.max_cache_entries + 1):
+        store.cache_found_token(f'user{i}', f'GV-{i:06d}', time.time() + 60)
+        if i == 0:
+            time.sleep(0.01)
+            store.cache_found_token('keep', 'GV-999999', time.time() + 60)
+        store.get_cached_token('keep')
+
+    finished = dict(new_job('frank', 'GV-222222', status='done', age=10))
+    store.save_job(finished)
+    store.purge_expired(job_ttl=5, lease=1.0)
+
+    return all([
+        check('expired lookup not returned', store.get_cached_token('expired') is None),
+        check('least recently used entry evicted', store.get_cached_token('user0') is None),
+        check('recently used entry kept', store.get_cached_token('keep') == 'GV-999999'),
+        check('finished job purged after job_ttl', store.get_job(finished['job_id']) is None),
+    ])
+
+def check_incomplete_backend():
+    class HalfStore(VerificationStore):
+        def issue_token(self, username, token, expires_at):
+            pass
+    try:
+        HalfStore()
+    except TypeError:
+        return check('incomplete backend rejected at construction', True)
+    return check('incomplete backend rejected at construction', False)
+
+def _claim(args):
+    path, attempt = args
+    store = SQLiteVerificationStore(path)
+    return store.claim_job(new_job('grace', 'GV-333333'), lease=60)[1]
+
+def check_claim_across_processes(path, processes=8, attempts=64):
+    """Workers sharing one SQLite file create exactly one job per username and token"""
+    SQLiteVerificationStore(path)
+    start = time.perf_counter()
+    with Pool(processes) as pool:
+        created = sum(pool.map(_claim, [(path, i) for i in range(attempts)]))
+    elapsed = time.perf_counter() - start
+    return check(f'{attempts} concurrent claims from {processes} processes create one job', created == 1,
+                 f'{created} created, {attempts / elapsed:,.0f} claims/s')
+
+def main():
+    print("🧪 Verification job store checks (memory and SQLite backends)")
+    print("=" * 60)
+    passed = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {
+            'memory': lambda: InMemoryVerificationStore(max_cache_entries=5),
+            'sqlite': lambda: SQLiteVerificationStore(os.path.join(tmp, f'{uuid.uuid4().hex}.db'), max_cache_entries=5),
+        }
+        for name, make_store in backends.items():
+            print(f"\n🗄️  {name}")
+            for run in (check_queued_jobs_survive, check_new_token_gets_new_job,
+                        check_abandoned_jobs, check_cache_and_ttl):
+                passed &= run(make_store())
+
+        print("\n🔒 shared SQLite file")
+        passed &= check_claim_across_processes(os.path.join(tmp, 'claims.db'))
+        passed &= check_incomplete_backend()
+
+    print(f"\n{'✅ All checks passed' if passed else '❌ Some checks failed'}")
+    return passed
+
+if __name__ == "__main__":
+    raise SystemExit(0 if main() else 1)
@@ -0,0 +1,1211 @@
+# goviral_api.py
+from flask import Flask, request, jsonify, g, Response
+import numpy as np
+import pandas as pd
+import pickle
+import os
+from flask_cors import CORS
+import random
+import requests
+import re
+import json
+import time
+import copy
+import hashlib
+import hmac
+import threading
+import logging
+from datetime import datetime
+from typing import Optional, Dict, Any, List, NamedTuple
+from goviral_tree_engine import CompiledForest, COMPILED_MODEL_DIR
+from insta_fetch_engine import ConcurrentFetchEngine, FetchStrategy
+from verification_jobs import VerificationJobManager, create_store
+from insta_profile_extractor import extract_profile, find_token
+from prediction_cache import PredictionCache
+from goviral_metrics import (REQUEST_SECONDS, configure_logging, merge_into_profile, metrics_payload,
+                             profile_summary, register_cache_collector, server_timing_header, span,
+                             start_profile, stop_profile)
+
+# Browser origins allowed to call the API ('*' for any); admin routes never get CORS headers
+CORS_ORIGINS = os.environ.get('GOVIRAL_CORS_ORIGINS', '*')
+
+app = Flask(__name__)
+CORS(app, resources={r'^/(?!model/).*': {'origins': CORS_ORIGINS.split(',') if CORS_ORIGINS != '*' else '*'}})
+
+# Numeric prediction inputs and their minimum values, checked in this order
+PREDICTION_FIELDS = [
+    'follower_count', 'avg_views', 'avg_interactions',
+    'new_followers_rate', 'accounts_reached'
+]
+MINIMUM_VALUES = [
+    ('follower_count', 1000, 'Follower count should be at least 1000'),
+    ('avg_views', 100, 'Average views should be at least 100'),
+    ('avg_interactions', 10, 'Average interactions should be at least 10'),
+    ('new_followers_rate', 0, 'New followers rate cannot be negative'),
+    ('accounts_reached', 100, 'Accounts reached should be at least 100'),
+]
+INVALID_TYPES_MESSAGE = 'Invalid data types. All numeric fields should be integers.'
+
+# Largest number of profiles accepted by /predict/batch in one call
+MAX_BATCH_SIZE = int(os.environ.get('GOVIRAL_MAX_BATCH_SIZE', 1000))
+
+# Verification store backend ('memory' or 'sqlite') and token lifetime
+VERIFICATION_STORE = os.environ.get('GOVIRAL_VERIFICATION_STORE', 'memory')
+VERIFICATION_DB_PATH = os.environ.get('GOVIRAL_VERIFICATION_DB', 'goviral_verification.db')
+VERIFICATION_TOKEN_TTL = int(os.environ.get('GOVIRAL_VERIFICATION_TOKEN_TTL', 900))
+# Seconds past the fetch deadline before an active job whose lease was not renewed is taken to be abandoned
+VERIFICATION_JOB_LEASE_MARGIN = int(os.environ.get('GOVIRAL_VERIFICATION_JOB_LEASE_MARGIN', 50))
+
+# How long /verify-and-predict waits for its verification job
+VERIFY_AND_PREDICT_TIMEOUT = 30
+
+# Size and lifetime of the /predict result cache (0 entries disables it)
+PREDICTION_CACHE_SIZE = int(os.environ.get('GOVIRAL_PREDICTION_CACHE_SIZE', 10000))
+PREDICTION_CACHE_TTL = int(os.environ.get('GOVIRAL_PREDICTION_CACHE_TTL', 300))
+
+# How often each worker checks the model artifact on disk for a new version (0 disables)
+MODEL_CHECK_INTERVAL = float(os.environ.get('GOVIRAL_MODEL_CHECK_INTERVAL', 5))
+
+# Token required by /model/reload; when unset only requests from this machine are accepted
+ADMIN_TOKEN = os.environ.get('GOVIRAL_ADMIN_TOKEN')
+
+# Log level and format ('text' or 'json'); per-attempt fetch details are DEBUG
+LOG_LEVEL = os.environ.get('GOVIRAL_LOG_LEVEL', 'INFO')
+LOG_FORMAT = os.environ.get('GOVIRAL_LOG_FORMAT', 'text')
+
+# Whether ?profile=1 (or an X-GoViral-Profile: 1 header) may return a stage breakdown
+PROFILING_ENABLED = os.environ.get('GOVIRAL_PROFILING', '1') == '1'
+
+configure_logging(LOG_LEVEL, LOG_FORMAT)
+logger = logging.getLogger('goviral.api')
+
+class InstagramVerificationSystem:
+    # Short names label the fetch strategies in logs and metrics
+    ALTERNATE_USER_AGENTS = {
+        'iphone': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
+        'android': 'Mozilla/5.0 (Linux; Android 10; SM-G981B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/80.0.3987.162 Mobile Safari/537.36',
+        'mac': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    }
+    JSON_ENDPOINT_HEADERS = {
+        'X-IG-App-ID': '936619743392459',
+        'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
+    }
+
+    def __init__(self, base_url='https://www.instagram.com', fetch_deadline=10.0):
+        self.base_url = base_url.rstrip('/')
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',  # brotli isn't installed; br bodies came back undecoded
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Cache-Control': 'max-age=0',
+        })
+        
+        # Shared async connection pool for the concurrent fetch strategies
+        self.fetch_engine = ConcurrentFetchEngine(headers=dict(self.session.headers), deadline=fetch_deadline)
+    
+    def generate_verification_token(self) -> str:
+        """Generate a random verification token"""
+        token_number = random.randint(100000, 999999)
+        return f"GV-{token_number}"
+    
+    def extract_verification_token(self, username: str) -> Optional[str]:
+        """
+        Extract verification token from Instagram by racing all fetch
+        strategies concurrently within one deadline budget
+        """
+        clean_username = self.clean_username(username)
+        logger.info("🔍 Checking: %s", clean_username)
+        
+        with span('fetch_race'):
+            token, strategy = self.fetch_engine.run(self.build_fetch_strategies(clean_username))
+        if token:
+            logger.info("✅ Token found for %s via %s", clean_username, strategy)
+            return token
+        
+        logger.info("❌ All methods failed for %s - profile may be private or blocked", clean_username)
+        return None
+
+    def extract_verification_token_sequential(self, username: str) -> Optional[str]:
+        """
+        Extract verification token by trying each method one after another
+        """
+        clean_username = self.clean_username(username)
+        logger.info("🔍 Checking: %s", clean_username)
+        
+        # Method 1: Try direct profile page
+        token = self.try_direct_scrape(clean_username)
+        if token:
+            return token
+        
+        # Method 2: Try with different user agents
+        token = self.try_with_different_agents(clean_username)
+        if token:
+            return token
+        
+        # Method 3: Try JSON endpoint (if available)
+        token = self.try_json_endpoint(clean_username)
+        if token:
+            return token
+        
+        logger.info("❌ All methods failed for %s - profile may be private or blocked", clean_username)
+        return None
+
+    def build_fetch_strategies(self, username: str) -> List[FetchStrategy]:
+        """Fetch strategies in priority order: direct page, other agents, JSON endpoint"""
+        profile_url = f"{self.base_url}/{username}/"
+        strategies = [FetchStrategy('direct', profile_url, self.parse_profile_html)]
+        
+        for name, agent in self.ALTERNATE_USER_AGENTS.items():
+            strategies.append(FetchStrategy(f"agent_{name}", profile_url,
+                                            self.parse_profile_html, {'User-Agent': agent}))
+        
+        json_url = f"{self.base_url}/api/v1/users/web_profile_info/?username={username}"
+        strategies.append(FetchStrategy('json', json_url, self.parse_profile_json,
+                                        self.JSON_ENDPOINT_HEADERS))
+        return strategies
+
+    def parse_profile_html(self, html: str) -> Optional[str]:
+        """Find the token in a profile page with one single-pass scan"""
+        with span('parse:html'):
+            profile = extract_profile(html, stop_at_token=True)
+        if profile['token']:
+            logger.debug("✅ Found in %s", profile['source'])
+        return profile['token']
+
+    def parse_profile_json(self, text: str) -> Optional[str]:
+        """Parse the web_profile_info JSON response"""
+        with span('parse:json'):
+            data = json.loads(text)
+            bio = data.get('data', {}).get('user', {}).get('biography', '')
+            return self.find_token_in_text(bio)
+
+    def try_direct_scrape(self, username: str) -> Optional[str]:
+        """Try scraping the main profile page"""
+        try:
+            url = f"{self.base_url}/{username}/"
+            logger.debug("Trying direct scrape: %s", url)
+            
+            response = self.session.get(url, timeout=10)
+            
+            if response.status_code != 200:
+                logger.debug("❌ HTTP %s", response.status_code)
+                return None
+            
+            return self.parse_profile_html(response.text)
+            
+        except Exception as e:
+            logger.debug("❌ Direct scrape error: %s", e)
+            return None
+
+    def try_with_different_agents(self, username: str) -> Optional[str]:
+        """Try with different user agents"""
+        for agent in self.ALTERNATE_USER_AGENTS.values():
+            try:
+                # Per-request header; the shared session must not be mutated
+                url = f"{self.base_url}/{username}/"
+                logger.debug("Trying with agent: %s...", agent[:50])
+                
+                response = self.session.get(url, headers={'User-Agent': agent}, timeout=10)
+                
+                if response.status_code == 200:
+                    token = self.parse_profile_html(response.text)
+                    if token:
+                        return token
+                        
+            except Exception as e:
+                logger.debug("❌ Agent error: %s", e)
+                continue
+                
+        return None
+
+    def try_json_endpoint(self, username: str) -> Optional[str]:
+        """Try to access JSON endpoints"""
+        try:
+            # Try the API-like endpoint
+            url = f"{self.base_url}/api/v1/users/web_profile_info/?username={username}"
+            
+            logger.debug("Trying JSON endpoint...")
+            response = self.session.get(url, headers=self.JSON_ENDPOINT_HEADERS, timeout=10)
+            
+            if response.status_code == 200:
+                data = response.json()
+                bio = data.get('data', {}).get('user', {}).get('biography', '')
+                token = self.find_token_in_text(bio)
+                if token:
+                    logger.debug("✅ Found via JSON endpoint")
+                    return token
+                    
+        except Exception as e:
+            logger.debug("❌ JSON endpoint error: %s", e)
+            
+        return None
+
+    def clean_username(self, username: str) -> str:
+        """Clean username from various formats"""
+        username = username.strip().lstrip('@')
+        
+        if 'instagram.com/' in username:
+            match = re.search(r'instagram\.com/([^/?]+)', username)
+            if match:
+                username = match.group(1)
+                
+        username = username.split('/')[0].split('?')[0]
+        return username
+
+    def find_token_in_text(self, text: str) -> Optional[str]:
+        """Find verification token in text"""
+        return find_token(text)
+
+    def verify_user(self, username: str, expected_token: str) -> Dict[str, Any]:
+        """Complete verification process"""
+        logger.info("🚀 Starting verification for: %s", username)
+        logger.debug("🔑 Expected token: %s", expected_token)
+        
+        with span('verify_user'):
+            start_time = time.time()
+            found_token = self.extract_verification_token(username)
+            verification_time = round(time.time() - start_time, 2)
+        
+        return self.build_verification_result(username, expected_token, found_token, verification_time)
+
+    def build_verification_result(self, username: str, expected_token: str, found_token: Optional[str],
+                                  verification_time: float, cached: bool = False) -> Dict[str, Any]:
+        """Compare the token found in the bio with the expected one"""
+        if found_token and found_token.upper() == expected_token.upper():
+            result = {
+                "verified": True,
+                "username": username,
+                "expected_token": expected_token,
+                "found_token": found_token,
+                "verification_time": verification_time,
+                "message": "✅ SUCCESS: Account verified!",
+                "timestamp": datetime.now().isoformat()
+            }
+        else:
+            result = {
+                "verified": False,
+                "username": username,
+                "expected_token": expected_token,
+                "found_token": found_token,
+                "verification_time": verification_time,
+                "message": f"❌ FAILED: Token not found. Expected: {expected_token}, Found: {found_token}",
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        result["cached"] = cached
+        return result
+
+class ModelBundle(NamedTuple):
+    """Everything one prediction needs, swapped in as a single reference"""
+    model: Any
+    scaler: Any
+    feature_names: List[str]
+    label_encoder: Any
+    version: str
+
+class GoViralPricePredictor:
+    def __init__(self, model_path='goviral_trained_model.pkl', compiled_path=COMPILED_MODEL_DIR,
+                 cache_size=PREDICTION_CACHE_SIZE, cache_ttl=PREDICTION_CACHE_TTL,
+                 check_interval=MODEL_CHECK_INTERVAL):
+        """Initialize the price predictor with trained model"""
+        self.model_path = model_path
+        self.compiled_path = compiled_path
+        self.check_interval = check_interval
+        self.bundle = None
+        self.prediction_cache = PredictionCache(cache_size, cache_ttl) if cache_size > 0 else None
+        self._reload_lock = threading.Lock()
+        self._next_check = 0.0
+        
+        self.load_model()
+    
+    @property
+    def model_version(self):
+        return self.bundle.version if self.bundle else None
+    
+    def artifact_path(self):
+        """File whose version identifies the model load_model would pick"""
+        if self.compiled_path and os.path.isdir(self.compiled_path):
+            return os.path.join(self.compiled_path, 'meta.json')
+        return self.model_path
+    
+    def load_model(self):
+        """Load the model artifact and invalidate cached predictions
+
+        Prefers the compiled node-table artifact when it exists, which loads
+        without pickle or sklearn and memory-maps the forest on first use.
+        Falls back to the pickled model otherwise.
+        """
+        model_path = self.model_path
+        compiled_path = self.compiled_path
+        
+        try:
+            if compiled_path and os.path.isdir(compiled_path):
+                model = CompiledForest(compiled_path)
+                model_data = {
+                    'model': model,
+                    'scaler': model.load_scaler(),
+                    'feature_names': model.feature_names,
+                    'label_encoder': model.load_label_encoder()
+                }
+                version = self.artifact_version(os.path.join(compiled_path, 'meta.json'))
+                message = "✅ Compiled model loaded successfully (version %s)"
+            else:
+                with open(model_path, 'rb') as f:
+                    model_data = pickle.load(f)
+                version = self.artifact_version(model_path)
+                message = "✅ Model loaded successfully (version %s)"
+            
+            # One reference swap, so a request never sees a mix of two models
+            self.bundle = ModelBundle(
+                model_data['model'], model_data['scaler'], model_data['feature_names'],
+                model_data['label_encoder'], version
+            )
+            logger.info(message, version)
+            
+        except FileNotFoundError:
+            raise Exception(f"Model file '{model_path}' not found.")
+        except Exception as e:
+            raise Exception(f"Error loading model: {e}")
+        
+        self._next_check = time.monotonic() + self.check_interval
+        if self.prediction_cache:
+            self.prediction_cache.clear()
+    
+    def current_bundle(self) -> ModelBundle:
+        """The loaded model, reloaded first if the artifact on disk has changed
+
+        Checked at most every check_interval seconds, so every worker process
+        picks up a newly exported model without its own /model/reload call.
+        """
+        if self.check_interval <= 0 or time.monotonic() < self._next_check:
+            return self.bundle
+        if not self._reload_lock.acquire(blocking=False):
+            return self.bundle  # another thread is checking; use the model we have
+        
+        try:
+            self._next_check = time.monotonic() + self.check_interval
+            if self.artifact_version(self.artifact_path()) != self.bundle.version:
+                self.load_model()
+        except Exception as e:
+            # Possibly caught mid-export; keep serving the old model and retry next interval
+            logger.warning("⚠️ Model artifact changed but could not be loaded: %s", e)
+        finally:
+            self._reload_lock.release()
+        return self.bundle
+    
+    @staticmethod
+    def artifact_version(path):
+        """Short id for a model artifact that changes whenever it is rewritten"""
+        stat = os.stat(path)
+        return hashlib.sha1(f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:12]
+    
+    def get_niche_list(self):
+        """Get list of available niches"""
+        bundle = self.current_bundle()
+        if bundle and bundle.label_encoder:
+            return list(bundle.label_encoder.classes_)
+        return []
+    
+    def predict_price(self, follower_count, avg_views, avg_interactions, 
+                     new_followers_rate, accounts_reached, niche):
+        """Predict price based on promoter metrics
+
+        Results are cached per model version, normalized feature vector and
+        niche, and concurrent requests for the same inputs share one model
+        call. Each caller gets its own copy of the result.
+        """
+        try:
+            features = (int(follower_count), int(avg_views), int(avg_interactions),
+                        int(new_followers_rate), int(accounts_reached))
+            niche = str(niche).strip().lower()
+            bundle = self.current_bundle()
+            
+            if not self.prediction_cache:
+                return self._predict_price(bundle, *features, niche)
+            
+            key = (bundle.version, features, niche)
+            with span('predict_cached'):
+                result = self.prediction_cache.get_or_compute(
+                    key, lambda: self._predict_price(bundle, *features, niche)
+                )
+            return copy.deepcopy(result)
+            
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': str(e)
+            }
+    
+    def _predict_price(self, bundle, follower_count, avg_views, avg_interactions,
+                       new_followers_rate, accounts_reached, niche):
+        """Run one bundle's model for one promoter; raises on invalid input"""
+        # Validate niche
+        if niche not in bundle.label_encoder.classes_:
+            available_niches = [str(n) for n in bundle.label_encoder.classes_]
+            raise ValueError(f"Invalid niche. Available: {available_niches}")
+        
+        # Encode niche
+        niche_encoded = bundle.label_encoder.transform([niche])[0]
+        
+        # Create input data
+        input_data = {
+            'follower_count': follower_count,
+            'avg_views': avg_views,
+            'avg_interactions': avg_interactions,
+            'new_followers_rate': new_followers_rate,
+            'accounts_reached': accounts_reached,
+            'niche_encoded': niche_encoded
+        }
+        
+        # Convert to DataFrame with correct feature order
+        input_df = pd.DataFrame([input_data])[bundle.feature_names]
+        
+        # Scale features
+        with span('scaler_transform'):
+            input_scaled = bundle.scaler.transform(input_df)
+        
+        # Predict price
+        with span('model_predict'):
+            predicted_price = bundle.model.predict(input_scaled)[0]
+        
+        # Calculate confidence range (±12%)
+        confidence_range = predicted_price * 0.12
+        min_price = max(300, predicted_price - confidence_range)
+        max_price = predicted_price + confidence_range
+        
+        # Determine confidence level
+        if follower_count > 50000:
+            confidence = "high"
+        elif follower_count > 10000:
+            confidence = "medium"
+        else:
+            confidence = "good"
+        
+        # Calculate engagement rate
+        engagement_rate = (avg_interactions / follower_count) * 100
+        
+        # Determine tier
+        if follower_count >= 100000:
+            tier = "macro_influencer"
+        elif follower_count >= 50000:
+            tier = "mid_tier_influencer"
+        elif follower_count >= 10000:
+            tier = "micro_influencer"
+        else:
+            tier = "nano_influencer"
+        
+        return {
+            'predicted_price': round(predicted_price, 2),
+            'price_range': {
+                'min': round(min_price, 2),
+                'max': round(max_price, 2)
+            },
+            'confidence': confidence,
+            'engagement_rate': round(engagement_rate, 2),
+            'tier': tier,
+            'status': 'success'
+        }
+
+    def predict_many(self, profiles):
+        """Predict prices for a batch of promoter profiles in one model pass
+
+        Each profile is a dict with the same fields as predict_price. Returns
+        one result per profile, in input order; invalid profiles get an error
+        result instead of failing the whole batch.
+        """
+        results = [None] * len(profiles)
+        rows = []
+        row_positions = []
+
+        for i, profile in enumerate(profiles):
+            if not isinstance(profile, dict):
+                results[i] = {'status': 'error', 'message': 'Profile must be a JSON object'}
+                continue
+
+            missing = [field for field in PREDICTION_FIELDS + ['niche'] if field not in profile]
+            if missing:
+                results[i] = {'status': 'error', 'message': f'Missing required field: {missing[0]}'}
+                continue
+
+            rows.append(profile)
+            row_positions.append(i)
+
+        if not rows:
+            return results
+
+        try:
+            bundle = self.current_bundle()
+
+            # Validate all rows together
+            with span('batch_validate'):
+                values, row_errors = validate_prediction_inputs(rows)
+                niches = np.array([str(row['niche']).strip().lower() for row in rows], dtype=object)
+
+                errors = np.array([messages[0] if messages else None for messages in row_errors], dtype=object)
+                pending = np.array([not messages for messages in row_errors], dtype=bool)
+
+                known_niche = np.isin(niches, bundle.label_encoder.classes_)
+                unknown = pending & ~known_niche
+                if unknown.any():
+                    available_niches = [str(niche) for niche in bundle.label_encoder.classes_]
+                    errors[unknown] = f"Invalid niche. Available: {available_niches}"
+                valid = pending & known_niche
+
+            predicted = np.empty(0)
+            if valid.any():
+                # Build the feature matrix in training order
+                features = {field: values[valid, j] for j, field in enumerate(PREDICTION_FIELDS)}
+                features['niche_encoded'] = bundle.label_encoder.transform(niches[valid])
+                X = np.column_stack([features[name] for name in bundle.feature_names])
+
+                # Scale and predict the whole batch at once
+                with span('scaler_transform'):
+                    X_scaled = (X - bundle.scaler.mean_) / bundle.scaler.scale_
+                with span('model_predict'):
+                    predicted = bundle.model.predict(X_scaled)
+
+            follower_count = values[valid, 0]
+            confidence_range = predicted * 0.12
+            min_price = np.maximum(300, predicted - confidence_range)
+            max_price = predicted + confidence_range
+            engagement_rate = values[valid, 2] / follower_count * 100
+            confidence = np.select(
+                [follower_count > 50000, follower_count > 10000],
+                ['high', 'medium'], default='good'
+            )
+            tier = np.select(
+                [follower_count >= 100000, follower_count >= 50000, follower_count >= 10000],
+                ['macro_influencer', 'mid_tier_influencer', 'micro_influencer'],
+                default='nano_influencer'
+            )
+
+            predicted = np.round(predicted, 2).tolist()
+            min_price = np.round(min_price, 2).tolist()
+            max_price = np.round(max_price, 2).tolist()
+            engagement_rate = np.round(engagement_rate, 2).tolist()
+            confidence = confidence.tolist()
+            tier = tier.tolist()
+
+            k = 0
+            for row, position in enumerate(row_positions):
+                if not valid[row]:
+                    results[position] = {'status': 'error', 'message': errors[row]}
+                    continue
+
+                results[position] = {
+                    'predicted_price': predicted[k],
+                    'price_range': {
+                        'min': min_price[k],
+                        'max': max_price[k]
+                    },
+                    'confidence': confidence[k],
+                    'engagement_rate': engagement_rate[k],
+                    'tier': tier[k],
+                    'status': 'success',
+                    'input_data': {
+                        **{field: int(values[row, j]) for j, field in enumerate(PREDICTION_FIELDS)},
+                        'niche': niches[row]
+                    }
+                }
+                k += 1
+
+        except Exception as e:
+            for position in row_positions:
+                results[position] = {'status': 'error', 'message': str(e)}
+
+        return results
+
+def parse_batch_request():
+    """Read a list of profiles from a JSON body or an NDJSON stream
+
+    Returns (profiles, line_errors), where line_errors maps the index of any
+    unparseable NDJSON line to its error message.
+    """
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        profiles = []
+        line_errors = {}
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                profiles.append(json.loads(line))
+            except ValueError:
+                line_errors[len(profiles)] = f'Invalid JSON on line {len(profiles) + 1}'
+                profiles.append(None)
+        return profiles, line_errors
+
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get('profiles')
+    if not isinstance(data, list):
+        raise ValueError('Expected a JSON list of profiles, {"profiles": [...]}, or an NDJSON body')
+    return data, {}
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return np.nan
+
+def validate_prediction_inputs(rows):
+    """Coerce and check the numeric prediction fields of each row
+
+    Shared by /predict, /predict/batch and /verify-and-predict. Every field
+    must be a finite whole number (1500, 1500.0 or "1500"); rows that pass
+    are then checked against MINIMUM_VALUES. Returns an (n, 5) float array
+    in PREDICTION_FIELDS order, zero in rows with a type error, and a list
+    of error messages per row (empty when the row is valid).
+    """
+    values = np.array([[_to_float(row[field]) for field in PREDICTION_FIELDS] for row in rows],
+                      dtype=float).reshape(len(rows), len(PREDICTION_FIELDS))
+    with np.errstate(invalid='ignore'):
+        whole = (np.isfinite(values) & (values == np.trunc(values))).all(axis=1)
+    values[~whole] = 0
+
+    errors = [[] if ok else [INVALID_TYPES_MESSAGE] for ok in whole]
+    for field, minimum, message in MINIMUM_VALUES:
+        for i in np.flatnonzero(whole & (values[:, PREDICTION_FIELDS.index(field)] < minimum)):
+            errors[i].append(message)
+    return values, errors
+
+# Initialize the predictor and verifier
+try:
+    predictor = GoViralPricePredictor()
+    verifier = InstagramVerificationSystem()
+    verification_jobs = VerificationJobManager(
+        verifier,
+        create_store(VERIFICATION_STORE, VERIFICATION_DB_PATH),
+        token_ttl=VERIFICATION_TOKEN_TTL,
+        job_lease=verifier.fetch_engine.deadline + VERIFICATION_JOB_LEASE_MARGIN
+    )
+    logger.info("✅ Both predictor and verifier initialized successfully!")
+except Exception as e:
+    logger.error("❌ Failed to initialize: %s", e)
+    predictor = None
+    verifier = None
+    verification_jobs = None
+
+# Looked up at scrape time, since /model/reload may replace the predictor
+register_cache_collector(lambda: predictor.prediction_cache if predictor else None)
+
+def job_response(job):
+    """Public view of a verification job"""
+    return {
+        'status': 'success',
+        'job_id': job['job_id'],
+        'job_status': job['status'],
+        'username': job['username'],
+        'poll_url': f"/verify/status/{job['job_id']}",
+        'result': job['result']
+    }
+
+# Request timing and opt-in profiling
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    g.profile_token = None
+    if PROFILING_ENABLED and (request.args.get('profile') == '1' or
+                              request.headers.get('X-GoViral-Profile') == '1'):
+        g.profile_token = start_profile()
+
+@app.after_request
+def record_request_timing(response):
+    elapsed = time.perf_counter() - g.request_start
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    REQUEST_SECONDS.labels(request.method, endpoint, str(response.status_code)).observe(elapsed)
+
+    if g.profile_token is not None:
+        profile = stop_profile(g.profile_token)
+        g.profile_token = None
+        response.headers['Server-Timing'] = server_timing_header(profile, elapsed)
+        data = response.get_json(silent=True) if response.is_json else None
+        if isinstance(data, dict):
+            data['profile'] = profile_summary(profile, elapsed)
+            response.set_data(app.json.dumps(data))
+
+    return response
+
+@app.teardown_request
+def discard_profile(exc):
+    # after_request is skipped when a view raises; don't leak the context value
+    if g.get('profile_token') is not None:
+        stop_profile(g.profile_token)
+
+def is_admin_request():
+    """Admin token when one is configured, otherwise only loopback callers"""
+    if ADMIN_TOKEN:
+        return hmac.compare_digest(request.headers.get('X-GoViral-Admin-Token', ''), ADMIN_TOKEN)
+    return request.remote_addr in ('127.0.0.1', '::1')
+
+# Routes
+@app.route('/')
+def home():
+    return jsonify({
+        'message': 'GoViral Price Prediction API with Instagram Verification',
+        'status': 'active',
+        'endpoints': {
+            '/predict': 'POST - Predict promotion price',
+            '/predict/batch': 'POST - Predict prices for a list or NDJSON stream of profiles',
+            '/verify/start': 'POST - Start Instagram verification',
+            '/verify/check': 'POST - Queue a verification check, returns a job id',
+            '/verify/status/<job_id>': 'GET - Poll a verification job',
+            '/niches': 'GET - Get available niches',
+            '/model/reload': 'POST - Reload the model artifact and clear cached predictions',
+            '/metrics': 'GET - Prometheus metrics',
+            '/health': 'GET - API health check'
+        },
+        'profiling': 'Add ?profile=1 to any request for a per-stage timing breakdown'
+    })
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    return jsonify({
+        'status': 'healthy' if predictor and verifier else 'unhealthy',
+        'predictor_loaded': predictor is not None,
+        'verifier_loaded': verifier is not None,
+        'model_version': predictor.model_version if predictor else None,
+        'prediction_cache': predictor.prediction_cache.stats() if predictor and predictor.prediction_cache else None
+    })
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    body, content_type = metrics_payload()
+    return Response(body, content_type=content_type)
+
+@app.route('/model/reload', methods=['POST'])
+def reload_model():
+    """Pick up a newly exported model in this worker without waiting
+
+    Every worker also checks the artifact on disk every
+    GOVIRAL_MODEL_CHECK_INTERVAL seconds and reloads on its own, so under a
+    multi-process server the others follow within that interval.
+    """
+    global predictor
+    
+    if not is_admin_request():
+        return jsonify({
+            'status': 'error',
+            'message': 'Not allowed. Send X-GoViral-Admin-Token, or call from the API host when no token is set.'
+        }), 403
+    
+    try:
+        if predictor:
+            predictor.load_model()
+        else:
+            predictor = GoViralPricePredictor()
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+    
+    return jsonify({
+        'status': 'success',
+        'model_version': predictor.model_version,
+        'message': 'Model reloaded and prediction cache cleared'
+    })
+
+@app.route('/niches', methods=['GET'])
+def get_niches():
+    if not predictor:
+        return jsonify({'status': 'error', 'message': 'Model not loaded'}), 500
+    
+    niches = predictor.get_niche_list()
+    return jsonify({
+        'status': 'success',
+        'niches': niches,
+        'count': len(niches)
+    })
+
+# # Instagram Verification Routes
+@app.route('/verify/start', methods=['POST'])
+def start_verification():
+    if not verification_jobs:
+        return jsonify({'status': 'error', 'message': 'Verification system not loaded'}), 500
+    
+    try:
+        data = request.get_json()
+        
+        if not data or 'username' not in data:
+            return jsonify({
+                'status': 'error',
+                'message': 'Username is required'
+            }), 400
+        
+        username = data['username'].strip()
+        if not username:
+            return jsonify({
+                'status': 'error',
+                'message': 'Username cannot be empty'
+            }), 400
+        
+        # Generate and remember the verification token
+        token = verification_jobs.start_verification(username)
+        
+        return jsonify({
+            'status': 'success',
+            'username': username,
+            'verification_token': token,
+            'expires_in': verification_jobs.token_ttl,
+            'instructions': f"Add this code to your Instagram bio: {token}",
+            'steps': [
+                "1. Go to your Instagram profile",
+                "2. Tap 'Edit Profile'",
+                f"3. Add '{token}' to your bio",
+                "4. Save changes",
+                "5. Click 'Verify Account' to complete"
+            ],
+            'message': 'Verification token generated successfully'
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Failed to start verification: {str(e)}'
+        }), 500
+
+@app.route('/verify/check', methods=['POST'])
+def check_verification():
+    if not verification_jobs:
+        return jsonify({'status': 'error', 'message': 'Verification system not loaded'}), 500
+    
+    try:
+        data = request.get_json()
+        
+        required_fields = ['username', 'verification_token']
+        for field in required_fields:
+            if field not in data:
+                return jsonify({
+                    'status': 'error',
+                    'message': f'Missing required field: {field}'
+                }), 400
+        
+        username = data['username'].strip()
+        token = data['verification_token'].strip()
+        
+        if not username or not token:
+            return jsonify({
+                'status': 'error',
+                'message': 'Username and token cannot be empty'
+            }), 400
+        
+        # Queue the check (or join one already running for this username)
+        try:
+            job = verification_jobs.submit(username, token)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
+        merge_into_profile(job.get('stages'))
+        return jsonify(job_response(job)), 200 if job['result'] else 202
+        
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Verification check failed: {str(e)}'
+        }), 500
+
+@app.route('/verify/status/<job_id>', methods=['GET'])
+def verification_status(job_id):
+    if not verification_jobs:
+        return jsonify({'status': 'error', 'message': 'Verification system not loaded'}), 500
+    
+    job = verification_jobs.get_job(job_id)
+    if not job:
+        return jsonify({
+            'status': 'error',
+            'message': 'Verification job not found'
+        }), 404
+    
+    merge_into_profile(job.get('stages'))
+    return jsonify(job_response(job)), 200 if job['result'] else 202
+
+@app.route('/predict', methods=['POST'])
+def predict_price():
+    if not predictor:
+        return jsonify({'status': 'error', 'message': 'Model not loaded'}), 500
+    
+    try:
+        # Get JSON data from request
+        with span('request_parse'):
+            data = request.get_json()
+        
+        with span('validation'):
+            # Validate required fields
+            for field in PREDICTION_FIELDS + ['niche']:
+                if field not in data:
+                    return jsonify({
+                        'status': 'error',
+                        'message': f'Missing required field: {field}'
+                    }), 400
+        
+            # Validate data types and minimum values
+            values, errors = validate_prediction_inputs([data])
+            if errors[0]:
+                return jsonify({
+                    'status': 'error',
+                    'message': errors[0][0]
+                }), 400
+        
+            follower_count, avg_views, avg_interactions, new_followers_rate, accounts_reached = (
+                int(value) for value in values[0]
+            )
+            niche = str(data['niche']).strip().lower()
+        
+        # Make prediction
+        prediction = predictor.predict_price(
+            follower_count=follower_count,
+            avg_views=avg_views,
+            avg_interactions=avg_interactions,
+            new_followers_rate=new_followers_rate,
+            accounts_reached=accounts_reached,
+            niche=niche
+        )
+        
+        if prediction['status'] == 'error':
+            return jsonify(prediction), 400
+        
+        # Add input data to response
+        prediction['input_data'] = {
+            'follower_count': follower_count,
+            'avg_views': avg_views,
+            'avg_interactions': avg_interactions,
+            'new_followers_rate': new_followers_rate,
+            'accounts_reached': accounts_reached,
+            'niche': niche
+        }
+        
+        return jsonify(prediction)
+        
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Internal server error: {str(e)}'
+        }), 500
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    """Predict prices for many profiles in a single call"""
+    if not predictor:
+        return jsonify({'status': 'error', 'message': 'Model not loaded'}), 500
+
+    try:
+        try:
+            profiles, line_errors = parse_batch_request()
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+
+        if not profiles:
+            return jsonify({
+                'status': 'error',
+                'message': 'No profiles provided'
+            }), 400
+
+        if len(profiles) > MAX_BATCH_SIZE:
+            return jsonify({
+                'status': 'error',
+                'message': f'Batch too large: {len(profiles)} profiles (max {MAX_BATCH_SIZE})'
+            }), 413
+
+        results = predictor.predict_many(profiles)
+        for index, message in line_errors.items():
+            results[index] = {'status': 'error', 'message': message}
+
+        for index, result in enumerate(results):
+            result['index'] = index
+
+        succeeded = sum(1 for result in results if result['status'] == 'success')
+
+        return jsonify({
+            'status': 'success',
+            'count': len(results),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'results': results
+        })
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Internal server error: {str(e)}'
+        }), 500
+
+# Combined verification and prediction endpoint
+# Combined verification and prediction endpoint
+@app.route('/verify-and-predict', methods=['POST'])
+def verify_and_predict():
+    """Combined endpoint for verification and price prediction"""
+    if not predictor or not verification_jobs:
+        return jsonify({'status': 'error', 'message': 'Systems not loaded'}), 500
+    
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({
+                'status': 'error',
+                'message': 'No JSON data provided'
+            }), 400
+        
+        # First, verify the account
+        if 'username' not in data or 'verification_token' not in data:
+            return jsonify({
+                'status': 'error',
+                'message': 'Username and verification_token are required for verification'
+            }), 400
+        
+        username = data['username'].strip()
+        token = data['verification_token'].strip()
+        
+        if not username or not token:
+            return jsonify({
+                'status': 'error',
+                'message': 'Username and verification_token cannot be empty'
+            }), 400
+        
+        logger.info("🔐 Starting verification for: %s", username)
+        
+        # Perform verification through the shared job queue
+        try:
+            job = verification_jobs.submit(username, token)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+        
+        with span('verification_wait'):
+            job = verification_jobs.wait(job, timeout=VERIFY_AND_PREDICT_TIMEOUT)
+        merge_into_profile(job.get('stages'))
+        if not job['result']:
+            return jsonify({
+                'status': 'pending',
+                'message': 'Verification is still running. Poll the job and retry.',
+                'job_id': job['job_id'],
+                'poll_url': f"/verify/status/{job['job_id']}"
+            }), 202
+        
+        verification_result = job['result']
+        
+        if not verification_result['verified']:
+            return jsonify({
+                'status': 'error',
+                'message': 'Account verification failed. Please make sure you added the token to your Instagram bio.',
+                'verification_details': verification_result
+            }), 400
+        
+        logger.info("✅ Account verified: %s", username)
+        
+        # If verified, proceed with prediction
+        missing_fields = [field for field in PREDICTION_FIELDS + ['niche'] if field not in data]
+        
+        if missing_fields:
+            return jsonify({
+                'status': 'error',
+                'message': f'Missing required fields for prediction: {", ".join(missing_fields)}'
+            }), 400
+        
+        # Validate data types and minimum values
+        values, errors = validate_prediction_inputs([data])
+        if errors[0]:
+            return jsonify({
+                'status': 'error',
+                'message': 'Validation errors',
+                'errors': errors[0]
+            }), 400
+        
+        follower_count, avg_views, avg_interactions, new_followers_rate, accounts_reached = (
+            int(value) for value in values[0]
+        )
+        niche = str(data['niche']).strip().lower()
+        
+        logger.debug("📊 Making prediction for verified account: %s", username)
+        
+        # Make prediction
+        prediction = predictor.predict_price(
+            follower_count=follower_count,
+            avg_views=avg_views,
+            avg_interactions=avg_interactions,
+            new_followers_rate=new_followers_rate,
+            accounts_reached=accounts_reached,
+            niche=niche
+        )
+        
+        if prediction['status'] == 'error':
+            return jsonify({
+                'status': 'error',
+                'message': 'Prediction failed',
+                'prediction_error': prediction['message']
+            }), 400
+        
+        # Combine results
+        combined_result = {
+            'status': 'success',
+            'message': 'Account verified and price prediction completed successfully',
+            'verified_account': username,
+            'verification': {
+                'verified': verification_result['verified'],
+                'username': verification_result['username'],
+                'token_matched': (verification_result['found_token'] or '').upper() == token.upper(),
+                'verification_time': verification_result['verification_time']
+            },
+            'prediction': {
+                'predicted_price': prediction['predicted_price'],
+                'price_range': prediction['price_range'],
+                'confidence': prediction['confidence'],
+                'engagement_rate': prediction['engagement_rate'],
+                'tier': prediction['tier']
+            },
+            'input_data': {
+                'follower_count': follower_count,
+                'avg_views': avg_views,
+                'avg_interactions': avg_interactions,
+                'new_followers_rate': new_followers_rate,
+                'accounts_reached': accounts_reached,
+                'niche': niche
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        logger.info("✅ Combined verification and prediction completed for: %s", username)
+        
+        return jsonify(combined_result)
+        
+    except Exception as e:
+        logger.exception("❌ Error in verify_and_predict: %s", e)
+        return jsonify({
+            'status': 'error',
+            'message': f'Combined verification and prediction failed: {str(e)}'
+        }), 500
+
+if __name__ == '__main__':
+    print("🚀 Starting GoViral Price Prediction API with Instagram Verification...")
+    print("📍 API Endpoints:")
+    print("   GET  /                   - API information")
+    print("   GET  /health             - Health check")
+    print("   GET  /niches             - Get available niches")
+    print("   POST /predict            - Predict promotion price")
+    print("   POST /predict/batch      - Predict prices for many profiles")
+    print("   POST /verify/start       - Start Instagram verification")
+    print("   POST /verify/check       - Queue a verification check")
+    print("   GET  /verify/status/<id> - Poll a verification job")
+    print("   POST /verify-and-predict - Verify account and predict price")
+    print("   POST /model/reload       - Reload model, clear prediction cache")
+    print("   GET  /metrics            - Prometheus metrics")
+    print("   Add ?profile=1 to any request for a stage timing breakdown")
+    print("\n📡 Server running on http://localhost:5000")
+    
+    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
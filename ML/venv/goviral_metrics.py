@@ -0,0 +1,136 @@
+# goviral_metrics.py
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Tuple
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+# Stages range from sub-millisecond model calls to multi-second scrapes
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+STAGE_SECONDS = Histogram(
+    'goviral_stage_seconds', 'Time spent in each instrumented stage',
+    ['stage'], buckets=LATENCY_BUCKETS
+)
+REQUEST_SECONDS = Histogram(
+    'goviral_request_seconds', 'HTTP request latency by endpoint',
+    ['method', 'endpoint', 'status'], buckets=LATENCY_BUCKETS
+)
+
+# Stage timings for the current request, or None when it is not being profiled.
+# Context variables follow run_coroutine_threadsafe and asyncio.to_thread, so
+# fetch strategies and parsers running off the request thread are included.
+_profile: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar('goviral_profile', default=None)
+
+class _Span:
+    __slots__ = ('stage', 'start')
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            # A losing fetch strategy; its partial time says nothing about the stage
+            return
+        elapsed = time.perf_counter() - self.start
+        STAGE_SECONDS.labels(self.stage).observe(elapsed)
+        profile = _profile.get()
+        if profile is not None:
+            profile.append((self.stage, elapsed))
+
+def span(stage: str) -> _Span:
+    """Time a block as `stage` in the stage histogram and the active profile"""
+    return _Span(stage)
+
+def start_profile():
+    """Start collecting stage timings for this request; returns a reset token"""
+    return _profile.set([])
+
+def stop_profile(token) -> List[Tuple[str, float]]:
+    """Stop collecting and return the (stage, seconds) pairs in finish order"""
+    profile = _profile.get() or []
+    _profile.reset(token)
+    return profile
+
+def merge_into_profile(stages: Optional[List[Tuple[str, float]]]):
+    """Add stages timed elsewhere, e.g. by a background job, to the active profile
+
+    Only the profile sees them; the histogram already has them from the
+    spans that produced them.
+    """
+    profile = _profile.get()
+    if profile is not None and stages:
+        profile.extend((stage, seconds) for stage, seconds in stages)
+
+def profile_summary(profile: List[Tuple[str, float]], total: float) -> dict:
+    return {
+        'total_ms': round(total * 1000, 3),
+        'stages': [{'stage': stage, 'ms': round(seconds * 1000, 3)} for stage, seconds in profile],
+    }
+
+def server_timing_header(profile: List[Tuple[str, float]], total: float) -> str:
+    """Stage timings in Server-Timing format, shown by browser dev tools"""
+    entries = [f'stage{i};desc="{stage}";dur={seconds * 1000:.3f}'
+               for i, (stage, seconds) in enumerate(profile)]
+    entries.append(f'total;dur={total * 1000:.3f}')
+    return ', '.join(entries)
+
+class PredictionCacheCollector:
+    """Export PredictionCache.stats() at scrape time"""
+
+    def __init__(self, get_cache: Callable):
+        self.get_cache = get_cache
+
+    def collect(self):
+        cache = self.get_cache()
+        if cache is None:
+            return
+
+        stats = cache.stats()
+        for name, help_text in (('hits', 'Prediction cache hits'),
+                                ('misses', 'Prediction cache misses'),
+                                ('coalesced', 'Requests that waited on an identical in-flight prediction'),
+                                ('evictions', 'Entries evicted by the size bound')):
+            yield CounterMetricFamily(f'goviral_prediction_cache_{name}', help_text, value=stats[name])
+        yield GaugeMetricFamily('goviral_prediction_cache_entries', 'Entries in the prediction cache',
+                                value=stats['entries'])
+
+def register_cache_collector(get_cache: Callable):
+    REGISTRY.register(PredictionCacheCollector(get_cache))
+
+def metrics_payload() -> Tuple[bytes, str]:
+    """Prometheus exposition body and content type"""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+def configure_logging(level: str = 'INFO', log_format: str = 'text'):
+    """Attach a handler to the 'goviral' logger namespace
+
+    Hot-path calls pass their values as logging arguments, so a disabled
+    level costs one level check and no string formatting. 'json' output
+    needs python-json-logger.
+    """
+    logger = logging.getLogger('goviral')
+    logger.setLevel(level.upper())
+    if logger.handlers:
+        return logger
+
+    handler = logging.StreamHandler()
+    if log_format == 'json':
+        try:
+            from pythonjsonlogger.json import JsonFormatter
+        except ImportError:
+            raise ImportError("JSON logging needs python-json-logger: pip install python-json-logger")
+        handler.setFormatter(JsonFormatter('%(asctime)s %(levelname)s %(name)s %(threadName)s %(message)s'))
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)-7s %(name)s: %(message)s'))
+
+    logger.addHandler(handler)
+    logger.propagate = False
+    return logger
@@ -0,0 +1,359 @@
+# goviral_training_pipeline.py
+import argparse
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import RandomizedSearchCV, train_test_split
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from goviral_model_trainer_fixed import GoviralPricePredictor, NICHES
+from goviral_tree_engine import CompiledForest, COMPILED_MODEL_DIR, export_compiled_model
+
+FEATURE_NAMES = GoviralPricePredictor().feature_names
+TARGET_NAME = 'price'
+
+# Compact dtypes used while reading: counts fit in int32 and prices need no
+# more than float32, which roughly halves memory against pandas' defaults
+COLUMN_DTYPES = {
+    'follower_count': 'int32',
+    'avg_views': 'int32',
+    'avg_interactions': 'int32',
+    'new_followers_rate': 'int32',
+    'accounts_reached': 'int32',
+    'niche': 'category',
+    'niche_encoded': 'int16',
+    'price': 'float32',
+}
+
+BACKENDS = ['forest', 'hgb']
+
+# Search spaces for RandomizedSearchCV, keyed by backend
+SEARCH_SPACES = {
+    'forest': {
+        'n_estimators': [100, 150, 200, 300],
+        'max_depth': [12, 16, 20, None],
+        'min_samples_split': [2, 5, 10],
+        'min_samples_leaf': [1, 2, 4],
+        'max_features': [1.0, 0.8, 0.5],
+    },
+    'hgb': {
+        'learning_rate': [0.03, 0.05, 0.1, 0.2],
+        'max_iter': [200, 400, 800],
+        'max_leaf_nodes': [15, 31, 63, 127],
+        'min_samples_leaf': [10, 20, 50],
+        'l2_regularization': [0.0, 0.1, 1.0],
+    },
+}
+
+def build_estimator(backend, seed=42, n_jobs=-1):
+    """Estimator with the defaults used when no search is run"""
+    if backend == 'forest':
+        # Same settings as GoviralPricePredictor.train_model
+        return RandomForestRegressor(
+            n_estimators=150,
+            max_depth=20,
+            min_samples_split=5,
+            min_samples_leaf=2,
+            random_state=seed,
+            n_jobs=n_jobs
+        )
+    if backend == 'hgb':
+        return HistGradientBoostingRegressor(max_iter=400, learning_rate=0.1, random_state=seed)
+    raise ValueError(f"Unknown backend: {backend}")
+
+def _read_chunks(path, chunk_size):
+    if path.endswith('.parquet'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet needs pyarrow: pip install pyarrow")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            chunk = batch.to_pandas()
+            yield chunk.astype({c: t for c, t in COLUMN_DTYPES.items() if c in chunk.columns})
+    else:
+        columns = pd.read_csv(path, nrows=0).columns
+        dtypes = {c: t for c, t in COLUMN_DTYPES.items() if c in columns}
+        yield from pd.read_csv(path, dtype=dtypes, chunksize=chunk_size)
+
+def load_dataset(path, chunk_size=500_000, max_rows=None):
+    """Stage 1: read a CSV or Parquet dataset in typed chunks
+
+    Returns the compact DataFrame with a niche_encoded column and the
+    LabelEncoder that maps niche names onto it.
+    """
+    print(f"\n📂 LOADING '{path}'")
+    print("=" * 50)
+    start = time.perf_counter()
+
+    chunks, rows = [], 0
+    for chunk in _read_chunks(path, chunk_size):
+        if max_rows is not None and rows + len(chunk) > max_rows:
+            chunk = chunk.iloc[:max_rows - rows]
+        chunks.append(chunk)
+        rows += len(chunk)
+        if max_rows is not None and rows >= max_rows:
+            break
+
+    if not chunks:
+        raise ValueError(f"No rows found in {path}")
+
+    missing = [c for c in FEATURE_NAMES[:-1] + [TARGET_NAME] if c not in chunks[0].columns]
+    if missing:
+        raise ValueError(f"Dataset is missing columns: {', '.join(missing)}")
+
+    if 'niche' in chunks[0].columns:
+        # Chunks see different subsets of niches; merge them into one sorted
+        # vocabulary so category codes line up with LabelEncoder's classes_
+        niche = union_categoricals([chunk.pop('niche') for chunk in chunks], sort_categories=True)
+        df = pd.concat(chunks, ignore_index=True)
+        label_encoder = LabelEncoder().fit(niche.categories.astype(str))
+        df['niche_encoded'] = niche.codes.astype('int16')
+    elif 'niche_encoded' in chunks[0].columns:
+        df = pd.concat(chunks, ignore_index=True)
+        if df['niche_encoded'].max() >= len(NICHES):
+            raise ValueError("niche_encoded values do not match the trainer's niche list; "
+                             "use a dataset with a 'niche' column")
+        print("⚠️  No 'niche' column; assuming niche_encoded follows the trainer's niche list")
+        label_encoder = LabelEncoder().fit(NICHES)
+    else:
+        raise ValueError("Dataset needs a 'niche' or 'niche_encoded' column")
+
+    memory_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"Rows: {len(df):,} in {len(chunks)} chunk(s), {memory_mb:,.1f} MB in memory")
+    print(f"Niches: {len(label_encoder.classes_)}")
+    print(f"Load time: {time.perf_counter() - start:.2f}s")
+
+    return df, label_encoder
+
+def split_dataset(df, test_size=0.2, seed=42):
+    """Stage 2: split into scaled float32 train and test matrices"""
+    # Kept as a DataFrame so the scaler records feature names like the trainer's does
+    X = df[FEATURE_NAMES].astype(np.float32)
+    y = df[TARGET_NAME].to_numpy(dtype=np.float32)
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=seed)
+
+    scaler = StandardScaler()
+    X_train = scaler.fit_transform(X_train)
+    X_test = scaler.transform(X_test)
+
+    print(f"\n✂️  Training set: {len(X_train):,} samples, testing set: {len(X_test):,} samples")
+    return X_train, X_test, y_train, y_test, scaler
+
+def fit_backend(backend, X_train, y_train, search_iter=0, search_rows=200_000,
+                cv=3, workers=1, seed=42):
+    """Stage 3: fit one backend, optionally after a randomized CV search
+
+    The search runs its candidates on a process pool of `workers` with each
+    estimator single-threaded, on at most `search_rows` training rows. The
+    best parameters are then refit on the full training set.
+    """
+    print(f"\n🤖 FITTING {backend.upper()}")
+    print("=" * 50)
+
+    search_seconds = 0.0
+    best_params = {}
+    if search_iter:
+        rng = np.random.default_rng(seed)
+        rows = min(search_rows, len(X_train))
+        sample = rng.choice(len(X_train), size=rows, replace=False) if rows < len(X_train) else slice(None)
+
+        search = RandomizedSearchCV(
+            build_estimator(backend, seed, n_jobs=1),
+            SEARCH_SPACES[backend],
+            n_iter=search_iter,
+            cv=cv,
+            scoring='neg_mean_absolute_error',
+            n_jobs=workers,
+            random_state=seed
+        )
+        print(f"Searching {search_iter} candidates x {cv} folds on {rows:,} rows ({workers} worker(s))...")
+        start = time.perf_counter()
+        search.fit(X_train[sample], y_train[sample])
+        search_seconds = time.perf_counter() - start
+        best_params = search.best_params_
+        print(f"Best CV MAE: ₹{-search.best_score_:,.2f} with {best_params}")
+
+    model = build_estimator(backend, seed, n_jobs=workers).set_params(**best_params)
+
+    print(f"Training on {len(X_train):,} rows...")
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+    print(f"Fit time: {fit_seconds:.2f}s")
+
+    return model, {'search_seconds': round(search_seconds, 2), 'fit_seconds': round(fit_seconds, 2),
+                   'best_params': best_params}
+
+def _best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def _compiled_cost(model, scaler, label_encoder, X_test):
+    # Size and throughput of the node-table artifact the API actually serves
+    with tempfile.TemporaryDirectory() as directory:
+        export_compiled_model(model, scaler, FEATURE_NAMES, label_encoder, directory)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        compiled = CompiledForest(directory)
+        sample = X_test[:10_000]
+        seconds = _best_time(lambda: compiled.predict(sample), 3)
+    return size, len(sample) / seconds
+
+def evaluate_backend(model, X_test, y_test, scaler, label_encoder, backend):
+    """Stage 4: accuracy and serving-cost metrics on the test set"""
+    y_pred = model.predict(X_test)
+
+    metrics = {
+        'r2': round(float(r2_score(y_test, y_pred)), 4),
+        'mae': round(float(mean_absolute_error(y_test, y_pred)), 2),
+        'mape': round(float(np.mean(np.abs((y_test - y_pred) / y_test)) * 100), 2),
+        'rmse': round(float(np.sqrt(mean_squared_error(y_test, y_pred))), 2),
+    }
+
+    batch_seconds = _best_time(lambda: model.predict(X_test), 3)
+    single_row = X_test[:1]
+    single_seconds = _best_time(lambda: model.predict(single_row), 20)
+    metrics['predict_rows_per_sec'] = int(len(X_test) / batch_seconds)
+    metrics['single_predict_ms'] = round(single_seconds * 1000, 2)
+    metrics['pickle_bytes'] = len(pickle.dumps(model))
+
+    if backend == 'forest':
+        compiled_bytes, compiled_rate = _compiled_cost(model, scaler, label_encoder, X_test)
+        metrics['compiled_bytes'] = compiled_bytes
+        metrics['compiled_rows_per_sec'] = int(compiled_rate)
+
+    return metrics, y_pred
+
+def export_model(backend, model, scaler, label_encoder, filename='goviral_trained_model.pkl',
+                 compiled_dir=COMPILED_MODEL_DIR):
+    """Stage 5: save the chosen model in the format the API loads
+
+    Only forests have a compiled form. Exporting another backend removes a
+    compiled artifact left at compiled_dir, since the API would otherwise
+    keep serving the old forest from it.
+    """
+    predictor = GoviralPricePredictor()
+    predictor.model = model
+    predictor.scaler = scaler
+    predictor.label_encoder = label_encoder
+
+    if backend == 'forest':
+        predictor.save_model(filename, compiled_dir=compiled_dir)
+    else:
+        predictor.save_model(filename, compiled_dir=None)
+        if compiled_dir and os.path.exists(os.path.join(compiled_dir, 'meta.json')):
+            shutil.rmtree(compiled_dir)
+            print(f"🗑️  Removed stale compiled model '{compiled_dir}/'")
+
+    return predictor
+
+def print_report(results):
+    print("\n📊 BACKEND COMPARISON")
+    print("=" * 94)
+    print(f"{'backend':<8}{'R²':>8}{'MAE':>11}{'MAPE':>8}{'fit':>9}{'rows/s':>11}"
+          f"{'1-row':>9}{'pickle':>11}{'compiled':>11}{'c rows/s':>9}")
+    for backend, result in results.items():
+        compiled = result.get('compiled_bytes')
+        compiled_size = f"{compiled / 1024 ** 2:>9.1f}MB" if compiled else f"{'-':>11}"
+        compiled_rate = f"{result['compiled_rows_per_sec']:>9,}" if compiled else f"{'-':>9}"
+        mae = f"₹{result['mae']:,.0f}"
+        print(f"{backend:<8}{result['r2']:>8.4f}{mae:>11}{result['mape']:>7.1f}%"
+              f"{result['fit_seconds']:>8.1f}s{result['predict_rows_per_sec']:>11,}"
+              f"{result['single_predict_ms']:>7.2f}ms{result['pickle_bytes'] / 1024 ** 2:>9.1f}MB"
+              f"{compiled_size}{compiled_rate}")
+
+def run_pipeline(data_path, backends=('forest',), search_iter=0, search_rows=200_000, cv=3,
+                 workers=1, chunk_size=500_000, max_rows=None, output='goviral_trained_model.pkl',
+                 compiled_dir=COMPILED_MODEL_DIR, select='mae', report_path=None, plots=False, seed=42):
+    """Load, split, fit every backend, evaluate, and export the best one"""
+    print("🚀 GoViral - Training Pipeline")
+    print("=" * 60)
+
+    df, label_encoder = load_dataset(data_path, chunk_size=chunk_size, max_rows=max_rows)
+    X_train, X_test, y_train, y_test, scaler = split_dataset(df, seed=seed)
+
+    if plots:
+        plotter = GoviralPricePredictor()
+        plotter.explore_data(df[FEATURE_NAMES + [TARGET_NAME]])
+    del df
+
+    results, models = {}, {}
+    for backend in backends:
+        model, fit_info = fit_backend(backend, X_train, y_train, search_iter=search_iter,
+                                      search_rows=search_rows, cv=cv, workers=workers, seed=seed)
+        metrics, y_pred = evaluate_backend(model, X_test, y_test, scaler, label_encoder, backend)
+        results[backend] = {**metrics, **fit_info}
+        models[backend] = model
+
+        if plots:
+            plotter.model = model
+            plotter.evaluate_model(X_test, y_test, y_pred)
+
+    print_report(results)
+
+    # Lower is better for errors, higher for R²
+    best = max(results, key=lambda b: results[b]['r2']) if select == 'r2' else \
+        min(results, key=lambda b: results[b][select])
+    print(f"\n🏆 Selected '{best}' by {select.upper()}")
+
+    export_model(best, models[best], scaler, label_encoder, output, compiled_dir)
+
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump({'data': data_path, 'rows': len(X_train) + len(X_test),
+                       'selected': best, 'backends': results}, f, indent=2, default=str)
+        print(f"📝 Report written to '{report_path}'")
+
+    return best, results
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="GoViral model training pipeline")
+    parser.add_argument('--data', default='goviral_proper_dataset.csv', help="Training .csv or .parquet file")
+    parser.add_argument('--backend', choices=BACKENDS + ['all'], default='forest',
+                        help="Model backend to train, or 'all' to compare them")
+    parser.add_argument('--search-iter', type=int, default=0,
+                        help="Randomized search candidates per backend (0 keeps the defaults)")
+    parser.add_argument('--search-rows', type=int, default=200_000, help="Training rows used by the search")
+    parser.add_argument('--cv', type=int, default=3, help="Cross-validation folds for the search")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processes for the search and threads for the final fit")
+    parser.add_argument('--chunk-size', type=int, default=500_000, help="Rows read per chunk")
+    parser.add_argument('--max-rows', type=int, help="Stop reading after this many rows")
+    parser.add_argument('--output', default='goviral_trained_model.pkl', help="Pickled model output")
+    parser.add_argument('--compiled-dir', default=COMPILED_MODEL_DIR, help="Compiled model output directory")
+    parser.add_argument('--select', choices=['mae', 'mape', 'rmse', 'r2'], default='mae',
+                        help="Metric used to pick the exported backend")
+    parser.add_argument('--report', help="Write the metrics as JSON to this file")
+    parser.add_argument('--plots', action='store_true', help="Show data and evaluation plots (needs matplotlib)")
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_pipeline(
+        args.data,
+        backends=BACKENDS if args.backend == 'all' else [args.backend],
+        search_iter=args.search_iter,
+        search_rows=args.search_rows,
+        cv=args.cv,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_rows=args.max_rows,
+        output=args.output,
+        compiled_dir=args.compiled_dir,
+        select=args.select,
+        report_path=args.report,
+        plots=args.plots,
+        seed=args.seed
+    )
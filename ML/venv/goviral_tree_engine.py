@@ -0,0 +1,160 @@
+# goviral_tree_engine.py
+import json
+import os
+import pickle
+import numpy as np
+
+COMPILED_MODEL_DIR = 'goviral_compiled_model'
+FORMAT_VERSION = 1
+
+# Node table arrays written as raw .npy files so they can be memory-mapped
+NODE_ARRAYS = ['children_left', 'children_right', 'feature', 'threshold', 'value', 'roots']
+
+def export_compiled_model(model, scaler, feature_names, label_encoder, directory=COMPILED_MODEL_DIR):
+    """Write a trained forest, scaler and niche vocabulary as flat node tables
+
+    All trees are concatenated into one set of arrays with global node ids,
+    so inference is a handful of array lookups and needs no pickle or sklearn.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    children_left, children_right, feature, threshold, value, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        is_leaf = tree.children_left == -1
+
+        # Leaves point at themselves so the walk can run a fixed number of steps
+        node_ids = np.arange(tree.node_count) + offset
+        children_left.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+        children_right.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+        value.append(tree.value[:, 0, 0])
+        roots.append(offset)
+
+        offset += tree.node_count
+        max_depth = max(max_depth, tree.max_depth)
+
+    arrays = {
+        'children_left': np.concatenate(children_left).astype(np.int32),
+        'children_right': np.concatenate(children_right).astype(np.int32),
+        'feature': np.concatenate(feature).astype(np.int32),
+        'threshold': np.concatenate(threshold).astype(np.float64),
+        'value': np.concatenate(value).astype(np.float64),
+        'roots': np.array(roots, dtype=np.int32),
+        'scaler_mean': np.asarray(scaler.mean_, dtype=np.float64),
+        'scaler_scale': np.asarray(scaler.scale_, dtype=np.float64),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f'{name}.npy'), array)
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'n_trees': len(roots),
+        'n_nodes': int(offset),
+        'max_depth': int(max_depth),
+        'feature_names': list(feature_names),
+        'niches': [str(niche) for niche in label_encoder.classes_],
+    }
+    with open(os.path.join(directory, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    return directory
+
+def export_from_pickle(model_path='goviral_trained_model.pkl', directory=COMPILED_MODEL_DIR):
+    """Convert an existing pickled model into the compiled format"""
+    with open(model_path, 'rb') as f:
+        model_data = pickle.load(f)
+
+    return export_compiled_model(
+        model_data['model'],
+        model_data['scaler'],
+        model_data['feature_names'],
+        model_data['label_encoder'],
+        directory
+    )
+
+class CompiledScaler:
+    """StandardScaler replacement backed by the exported mean and scale"""
+
+    def __init__(self, mean, scale):
+        self.mean_ = mean
+        self.scale_ = scale
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_
+
+class CompiledLabelEncoder:
+    """LabelEncoder replacement for the exported niche vocabulary"""
+
+    def __init__(self, classes):
+        self.classes_ = np.array(sorted(classes))
+
+    def transform(self, labels):
+        labels = np.asarray(labels)
+        unknown = ~np.isin(labels, self.classes_)
+        if unknown.any():
+            raise ValueError(f"y contains previously unseen labels: {labels[unknown].tolist()}")
+        return np.searchsorted(self.classes_, labels)
+
+class CompiledForest:
+    """NumPy tree-walking inference over the exported node tables
+
+    Only meta.json is read up front; the node arrays are memory-mapped on
+    first use, so forked workers share the same read-only pages.
+    """
+
+    def __init__(self, directory=COMPILED_MODEL_DIR):
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json')) as f:
+            self.meta = json.load(f)
+
+        if self.meta.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported compiled model format: {self.meta.get('format_version')}")
+
+        self.feature_names = self.meta['feature_names']
+        self.max_depth = self.meta['max_depth']
+        self._arrays = None
+
+    def _load_array(self, name):
+        return np.load(os.path.join(self.directory, f'{name}.npy'), mmap_mode='r')
+
+    @property
+    def arrays(self):
+        if self._arrays is None:
+            self._arrays = {name: self._load_array(name) for name in NODE_ARRAYS}
+        return self._arrays
+
+    def load_scaler(self):
+        return CompiledScaler(self._load_array('scaler_mean'), self._load_array('scaler_scale'))
+
+    def load_label_encoder(self):
+        return CompiledLabelEncoder(self.meta['niches'])
+
+    def predict(self, X):
+        """Average the leaf values reached in every tree for each row of X"""
+        arrays = self.arrays
+        # sklearn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+
+        nodes = np.broadcast_to(arrays['roots'], (X.shape[0], arrays['roots'].shape[0]))
+        for _ in range(self.max_depth):
+            go_left = X[rows, arrays['feature'][nodes]] <= arrays['threshold'][nodes]
+            nodes = np.where(go_left, arrays['children_left'][nodes], arrays['children_right'][nodes])
+
+        return arrays['value'][nodes].mean(axis=1)
+
+def main():
+    """Convert goviral_trained_model.pkl into the compiled format"""
+    print("🔧 Exporting compiled model from 'goviral_trained_model.pkl'...")
+    directory = export_from_pickle()
+    forest = CompiledForest(directory)
+    print(f"✅ Compiled model saved to '{directory}/'")
+    print(f"   Trees: {forest.meta['n_trees']}, Nodes: {forest.meta['n_nodes']:,}, Max depth: {forest.max_depth}")
+
+if __name__ == "__main__":
+    main()
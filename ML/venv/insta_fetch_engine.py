@@ -0,0 +1,140 @@
+# insta_fetch_engine.py
+import asyncio
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+import httpx
+from goviral_metrics import span
+
+logger = logging.getLogger('goviral.fetch')
+
+class FetchStrategy:
+    """One way of fetching a profile: a URL, extra headers and a parser
+
+    `name` labels the strategy's fetch stage in metrics, so keep it short
+    and stable (e.g. 'json', not the User-Agent it sends).
+    """
+
+    def __init__(self, name: str, url: str, parse: Callable[[str], Optional[str]],
+                 headers: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.url = url
+        self.parse = parse
+        self.headers = headers or {}
+
+class ConcurrentFetchEngine:
+    """Race several fetch strategies and return the first token found
+
+    All strategies share one httpx.AsyncClient connection pool running on a
+    background event loop, so the engine can be called from any Flask
+    worker thread. Strategy starts are staggered by `stagger` seconds to
+    hedge rather than flood, and everything is bounded by one overall
+    `deadline` budget; the remaining attempts are cancelled on first success.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, deadline: float = 10.0,
+                 stagger: float = 0.25, max_connections: int = 20):
+        self.headers = dict(headers or {})
+        self.deadline = deadline
+        self.stagger = stagger
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_connections)
+        self._loop = None
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='insta-fetch-engine', daemon=True)
+                thread.start()
+                self._loop = loop
+        return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Only ever called on the engine's own loop
+        if self._client is None:
+            self._client = httpx.AsyncClient(headers=self.headers, limits=self.limits,
+                                             follow_redirects=True)
+        return self._client
+
+    def run(self, strategies: List[FetchStrategy], deadline: Optional[float] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Race strategies from synchronous code; returns (token, strategy name)"""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.race(strategies, deadline), loop)
+        return future.result()
+
+    async def _attempt(self, strategy: FetchStrategy, delay: float, deadline_at: float) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        if delay:
+            await asyncio.sleep(delay)
+
+        remaining = deadline_at - loop.time()
+        if remaining <= 0:
+            return None
+
+        logger.debug("Trying %s: %s", strategy.name, strategy.url)
+        with span(f'fetch:{strategy.name}'):
+            response = await self._get_client().get(strategy.url, headers=strategy.headers, timeout=remaining)
+
+        if response.status_code != 200:
+            logger.debug("❌ %s: HTTP %s", strategy.name, response.status_code)
+            return None
+
+        # Parsing multi-hundred-KB pages is CPU work; keep it off the event loop
+        return await asyncio.to_thread(strategy.parse, response.text)
+
+    async def race(self, strategies: List[FetchStrategy], deadline: Optional[float] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Run strategies concurrently and return the first (token, name) found"""
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + (self.deadline if deadline is None else deadline)
+
+        tasks = {
+            asyncio.create_task(self._attempt(strategy, i * self.stagger, deadline_at)): strategy
+            for i, strategy in enumerate(strategies)
+        }
+        pending = set(tasks)
+
+        try:
+            while pending:
+                remaining = deadline_at - loop.time()
+                if remaining <= 0:
+                    logger.info("⏱️ Fetch deadline reached")
+                    break
+
+                done, pending = await asyncio.wait(pending, timeout=remaining,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    strategy = tasks[task]
+                    if task.exception():
+                        logger.debug("❌ %s error: %s", strategy.name, task.exception())
+                        continue
+
+                    token = task.result()
+                    if token:
+                        logger.debug("✅ Found via %s", strategy.name)
+                        return token, strategy.name
+
+            return None, None
+
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def close(self):
+        """Close the connection pool and stop the background loop"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        async def shutdown():
+            if self._client is not None:
+                await self._client.aclose()
+                self._client = None
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
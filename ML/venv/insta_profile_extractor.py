@@ -0,0 +1,226 @@
+# insta_profile_extractor.py
+import json
+import re
+from html import unescape
+from typing import Any, Dict, Optional, Tuple
+
+# Verification token formats in priority order; GV- is the one this system issues
+TOKEN_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'GV-\d{6}',
+        r'VERIFY-\d{6}',
+        r'CODE-\d{6}',
+        r'AUTH-\d{6}',
+        r'TOKEN-\d{6}',
+        r'[A-Z]{2,4}-\d{4,8}',
+    )
+]
+# Matches wherever any of the patterns above would, so one search rules them all out
+ANY_TOKEN = re.compile(r'[A-Z]{2,4}-\d{4,8}', re.IGNORECASE)
+# Every token contains this; a literal-prefix search for it is far cheaper than
+# running the letter classes over a whole page
+TOKEN_ANCHOR = re.compile(r'-\d{4}')
+
+# One scan over the page markup: scripts and styles are consumed whole, meta
+# tags are captured and other tags skipped. The gaps between matches are the
+# visible text.
+PAGE_SCANNER = re.compile(r"""<(?:
+    script\b(?P<script_attrs>[^>]*)>(?P<script_body>.*?)</script\s*>
+  | style\b.*?</style\s*>
+  | meta\b(?P<meta>[^>]*)>
+  | [^>]*>
+)""", re.DOTALL | re.IGNORECASE | re.VERBOSE)
+
+SHARED_DATA = re.compile(r'window\._sharedData\s*=\s*(\{.+\})\s*;?\s*$', re.DOTALL)
+META_ATTR = re.compile(r'(name|property|content)\s*=\s*"([^"]*)"', re.IGNORECASE)
+META_COUNTS = re.compile(
+    r'([\d.,]+[KMB]?)\s+Followers?,\s*([\d.,]+[KMB]?)\s+Following,\s*([\d.,]+[KMB]?)\s+Posts?',
+    re.IGNORECASE
+)
+META_NAME = re.compile(r'from\s+(.*?)\s*\(@([\w.]+)\)')
+
+# Token sources in the order the old parser chain tried them
+SOURCE_PRIORITY = {'_sharedData': 0, 'JSON-LD': 1, 'meta description': 2, 'raw text': 3}
+
+PROFILE_FIELDS = ['username', 'full_name', 'biography', 'follower_count', 'following_count', 'post_count']
+
+def _rank_token(text: Optional[str]) -> Optional[Tuple[int, str]]:
+    # (index of the first pattern that matches, its first match)
+    if not text or not ANY_TOKEN.search(text):
+        return None
+
+    for rank, pattern in enumerate(TOKEN_PATTERNS):
+        match = pattern.search(text)
+        if match:
+            return rank, match.group(0).upper()
+
+    return None
+
+def find_token(text: Optional[str]) -> Optional[str]:
+    """Find a verification token in text, preferring the GV- format"""
+    ranked = _rank_token(text)
+    return ranked[1] if ranked else None
+
+def _find_token_in_span(text: str, start: int, end: int) -> Optional[Tuple[int, str]]:
+    # Search text[start:end] without slicing it, checking only around anchors.
+    # Every anchor is checked before a lower-priority match is accepted, so a
+    # GV- token later in the span beats an earlier generic one.
+    best = None
+    anchor = TOKEN_ANCHOR.search(text, start, end)
+    while anchor:
+        dash = anchor.start()
+        # Longest prefix is VERIFY- (6 letters), longest suffix 8 digits
+        ranked = _rank_token(text[max(start, dash - 6):min(end, dash + 9)])
+        if ranked and (best is None or ranked[0] < best[0]):
+            if ranked[0] == 0:
+                return ranked
+            best = ranked
+        anchor = TOKEN_ANCHOR.search(text, dash + 1, end)
+    return best
+
+def parse_count(text: Optional[str]) -> Optional[int]:
+    """Parse counts like 1,234 or 1.2M or 12K into an integer"""
+    if not text:
+        return None
+
+    text = text.strip().upper().replace(',', '')
+    multiplier = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}.get(text[-1:], 1)
+    if multiplier > 1:
+        text = text[:-1]
+
+    try:
+        return int(float(text) * multiplier)
+    except ValueError:
+        return None
+
+def _fill(profile: Dict[str, Any], **values):
+    # Earlier (higher priority) sources win; only fill what is still missing
+    for field, value in values.items():
+        if profile.get(field) is None and value not in (None, ''):
+            profile[field] = value
+
+def _record(profile: Dict[str, Any], found: Optional[Tuple[int, str]], source: str):
+    # Keep the token from the highest-priority source, then the best pattern;
+    # on a tie the first one found wins
+    if not found:
+        return
+    rank = (SOURCE_PRIORITY[source], found[0])
+    if profile['_rank'] is None or rank < profile['_rank']:
+        profile['_rank'] = rank
+        profile['token'] = found[1]
+        profile['source'] = source
+
+def _from_shared_data(profile, body):
+    match = SHARED_DATA.search(body)
+    if not match:
+        return None
+
+    data = json.loads(match.group(1))
+    user = data.get('entry_data', {}).get('ProfilePage', [{}])[0].get('graphql', {}).get('user', {})
+    _fill(
+        profile,
+        username=user.get('username'),
+        full_name=user.get('full_name'),
+        biography=user.get('biography'),
+        follower_count=user.get('edge_followed_by', {}).get('count'),
+        following_count=user.get('edge_follow', {}).get('count'),
+        post_count=user.get('edge_owner_to_timeline_media', {}).get('count'),
+    )
+    return _rank_token(user.get('biography', ''))
+
+def _from_json_ld(profile, body):
+    data = json.loads(body)
+    description = data.get('description', '') or data.get('articleBody', '')
+
+    entity = data.get('mainEntityofPage') or data.get('mainEntity') or data
+    statistic = entity.get('interactionStatistic') if isinstance(entity, dict) else None
+    followers = None
+    if isinstance(statistic, dict) and 'Follow' in str(statistic.get('interactionType', '')):
+        followers = statistic.get('userInteractionCount')
+
+    _fill(
+        profile,
+        username=data.get('alternateName', '').lstrip('@') or None,
+        full_name=data.get('name'),
+        biography=description,
+        follower_count=parse_count(str(followers)) if followers is not None else None,
+    )
+    return _rank_token(description)
+
+def _from_meta(profile, attrs):
+    values = {key.lower(): value for key, value in META_ATTR.findall(attrs)}
+    kind = values.get('name') or values.get('property')
+    if kind not in ('description', 'og:description'):
+        return None
+
+    content = unescape(values.get('content', ''))
+    counts = META_COUNTS.search(content)
+    if counts:
+        _fill(
+            profile,
+            follower_count=parse_count(counts.group(1)),
+            following_count=parse_count(counts.group(2)),
+            post_count=parse_count(counts.group(3)),
+        )
+    name = META_NAME.search(content)
+    if name:
+        _fill(profile, full_name=name.group(1), username=name.group(2))
+    if not counts:
+        _fill(profile, biography=content)
+
+    return _rank_token(content)
+
+def _text_can_improve(profile: Dict[str, Any]) -> bool:
+    # Visible text only matters until a higher-priority source or a GV- token
+    # has been found
+    rank = profile['_rank']
+    return rank is None or (rank[0] == SOURCE_PRIORITY['raw text'] and rank[1] > 0)
+
+def extract_profile(html: str, stop_at_token: bool = False) -> Dict[str, Any]:
+    """Pull the verification token and profile fields out of a page in one scan
+
+    Looks at window._sharedData, JSON-LD, description meta tags and visible
+    text as they are encountered. The token is picked as the old parser chain
+    did: by source in that order, then GV- before other formats. With
+    stop_at_token the scan ends at the first GV- token, which is all
+    verification needs.
+    """
+    profile = dict.fromkeys(PROFILE_FIELDS)
+    profile['token'] = None
+    profile['source'] = None
+    profile['_rank'] = None
+
+    text_start = 0
+    for match in PAGE_SCANNER.finditer(html):
+        # Visible text between the previous tag and this one
+        if _text_can_improve(profile):
+            _record(profile, _find_token_in_span(html, text_start, match.start()), 'raw text')
+        text_start = match.end()
+
+        if match.group('script_body') is not None:
+            attrs = match.group('script_attrs')
+            body = match.group('script_body')
+            try:
+                if 'ld+json' in attrs:
+                    _record(profile, _from_json_ld(profile, body), 'JSON-LD')
+                elif '_sharedData' in body:
+                    _record(profile, _from_shared_data(profile, body), '_sharedData')
+            except (ValueError, AttributeError, IndexError, TypeError):
+                # Malformed embedded JSON; keep scanning the rest of the page
+                pass
+
+        elif match.group('meta') is not None:
+            _record(profile, _from_meta(profile, match.group('meta')), 'meta description')
+
+        if stop_at_token and profile['_rank'] is not None and profile['_rank'][1] == 0:
+            break
+    else:
+        if _text_can_improve(profile):
+            _record(profile, _find_token_in_span(html, text_start, len(html)), 'raw text')
+
+    del profile['_rank']
+    return profile
+
+def find_token_in_html(html: str) -> Optional[str]:
+    """Return the first verification token found in a profile page"""
+    return extract_profile(html, stop_at_token=True)['token']
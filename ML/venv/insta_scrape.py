@@ -0,0 +1,191 @@
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.chrome.service import Service
+import threading
+import re
+from insta_profile_extractor import extract_profile
+from insta_scrape_pool import HostRateLimiter, PooledScraper
+
+# Multiple selectors for follower count (Instagram changes these frequently)
+FOLLOWER_SELECTORS = [
+    "//section//a[contains(@href, 'followers')]//span",
+    "//a[contains(@href, '/followers/')]//span",
+    "//header//a[contains(@href, 'followers')]//span",
+    "//span[contains(text(), 'followers')]/preceding-sibling::span",
+    "//li[contains(*, 'followers')]//span"
+]
+
+class InstagramSeleniumScraper:
+    # ChromeDriverManager().install() hits the network; resolve it once per process
+    _driver_path = None
+    _driver_path_lock = threading.Lock()
+
+    def __init__(self, headless=True, page_timeout=10):
+        self.headless = headless
+        self.page_timeout = page_timeout
+        self.driver = None
+        self.setup_driver()
+    
+    def setup_driver(self):
+        """Setup Chrome driver with appropriate options"""
+        chrome_options = Options()
+        
+        if self.headless:
+            chrome_options.add_argument("--headless")
+        
+        # Anti-detection options
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        
+        # Counts are in the markup; don't wait for images or every subresource
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.page_load_strategy = 'eager'
+        
+        with InstagramSeleniumScraper._driver_path_lock:
+            if InstagramSeleniumScraper._driver_path is None:
+                InstagramSeleniumScraper._driver_path = ChromeDriverManager().install()
+        
+        service = Service(InstagramSeleniumScraper._driver_path)
+        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # Execute CDP commands to prevent detection
+        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    
+    def get_follower_count_public(self, instagram_url):
+        """
+        Get follower count from public Instagram profile without login
+        """
+        try:
+            print(f"🌐 Opening: {instagram_url}")
+            self.driver.get(instagram_url)
+            
+            # The og:description meta tag is in the page source as soon as it loads
+            followers = extract_profile(self.driver.page_source)['follower_count']
+            
+            if not followers:
+                # One wait for whichever selector matches first, instead of a
+                # fixed sleep plus a full timeout per selector that doesn't
+                try:
+                    elements = WebDriverWait(self.driver, self.page_timeout).until(
+                        EC.presence_of_all_elements_located((By.XPATH, " | ".join(FOLLOWER_SELECTORS)))
+                    )
+                except Exception:
+                    elements = []
+                
+                for element in elements:
+                    follower_text = element.text.strip()
+                    
+                    # Parse the number (handle formats like "1,234,567" or "1.2M")
+                    followers = self.parse_follower_count(follower_text) if follower_text else None
+                    if followers:
+                        print(f"📊 Found follower text: {follower_text}")
+                        break
+            
+            if followers:
+                print(f"✅ Follower count: {followers:,}")
+                return followers
+            else:
+                print("❌ Could not find follower count")
+                return None
+                
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return None
+    
+    def parse_follower_count(self, text):
+        """
+        Parse follower count text into integer
+        Handles formats like: 1,234,567 or 1.2M or 1.2K
+        """
+        # Remove any non-numeric characters except dots and commas
+        clean_text = re.sub(r'[^\d.,]', '', text)
+        
+        try:
+            if 'M' in text or 'm' in text:  # Millions
+                number = float(clean_text.replace(',', ''))
+                return int(number * 1_000_000)
+            elif 'K' in text or 'k' in text:  # Thousands
+                number = float(clean_text.replace(',', ''))
+                return int(number * 1_000)
+            else:  # Regular number
+                return int(clean_text.replace(',', ''))
+        except:
+            return None
+    
+    def get_multiple_followers(self, urls, rate_limiter=None):
+        """Get follower counts for multiple URLs on this browser"""
+        rate_limiter = rate_limiter or HostRateLimiter(min_interval=3.0)
+        results = {}
+        
+        for url in urls:
+            print(f"\n🔍 Processing: {url}")
+            # Jittered per-host spacing instead of a fixed sleep after every URL
+            rate_limiter.acquire(url)
+            followers = self.get_follower_count_public(url)
+            results[url] = followers
+            
+            if followers is None:
+                rate_limiter.backoff(url)
+            else:
+                rate_limiter.success(url)
+        
+        return results
+    
+    @classmethod
+    def get_multiple_followers_pooled(cls, urls, output_path, workers=4, headless=True,
+                                      http_first=True, min_interval=2.0):
+        """Scrape many URLs on a pool of browsers, streaming results to output_path
+
+        Plain HTTP is tried first; browsers are only started for pages that
+        need one. Re-running with the same output_path resumes where an
+        interrupted run stopped. Returns a summary of the run.
+        """
+        scraper = PooledScraper(
+            workers=workers,
+            browser_factory=lambda: cls(headless=headless),
+            rate_limiter=HostRateLimiter(min_interval=min_interval),
+            http_first=http_first
+        )
+        return scraper.run(urls, output_path)
+    
+    def close(self):
+        """Close the browser"""
+        if self.driver:
+            self.driver.quit()
+
+# Usage Example
+def main():
+    scraper = InstagramSeleniumScraper(headless=False)  # Set to False to see browser
+    
+    # List of Instagram profile URLs
+    instagram_urls = [
+        "https://www.instagram.com/samarth_deshpande11?igsh=MXdiZjJzcmozYnNycg=="
+        # Add more URLs here
+    ]
+    
+    try:
+        results = scraper.get_multiple_followers(instagram_urls)
+        
+        print("\n" + "="*50)
+        print("📊 FINAL RESULTS")
+        print("="*50)
+        for url, followers in results.items():
+            username = url.split('/')[-2] if url.split('/')[-2] else url.split('/')[-1]
+            if followers:
+                print(f"👤 {username}: {followers:,} followers")
+            else:
+                print(f"👤 {username}: Failed to get followers")
+                
+    finally:
+        scraper.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
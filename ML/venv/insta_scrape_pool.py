@@ -0,0 +1,344 @@
+# insta_scrape_pool.py
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+import requests
+from insta_profile_extractor import extract_profile
+
+# Responses that mean "slow down" rather than "this profile has no data"
+THROTTLE_STATUSES = (429, 503)
+
+# Error for profiles that do not exist; these are not retried on resume
+NOT_FOUND = 'Profile not found'
+
+DESKTOP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+class HostRateLimiter:
+    """Space out requests to each host, with jittered exponential backoff
+
+    acquire() reserves the host's next start slot and sleeps until it, so
+    any number of worker threads together stay at or below one request per
+    min_interval (plus up to `jitter` of it at random). backoff() pushes the
+    host's next slot out after a throttled or blocked response; success()
+    resets the backoff.
+    """
+
+    def __init__(self, min_interval: float = 2.0, jitter: float = 0.5,
+                 backoff_base: float = 5.0, max_backoff: float = 120.0):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self._next_slot = {}
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to url's host may start; returns seconds waited"""
+        host = self.host(url)
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = start + self.min_interval * (1 + self.jitter * random.random())
+
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def backoff(self, url: str) -> float:
+        """Delay the host's next request after a throttle; returns the delay"""
+        host = self.host(url)
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            ceiling = min(self.max_backoff, self.backoff_base * 2 ** (failures - 1))
+            delay = random.uniform(ceiling / 2, ceiling)
+            now = time.monotonic()
+            self._next_slot[host] = max(self._next_slot.get(host, now), now + delay)
+        return delay
+
+    def success(self, url: str):
+        with self._lock:
+            self._failures.pop(self.host(url), None)
+
+class ResultStream:
+    """Append-only JSON Lines file of scrape results, flushed per record
+
+    Every finished URL is written as soon as it completes, so an interrupted
+    run loses at most the URLs that were in flight. completed() reads the
+    file back for resuming.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        # A run killed mid-write leaves a partial last line; start on a fresh one
+        needs_newline = False
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+
+        self._file = open(path, 'a', encoding='utf-8')
+        if needs_newline:
+            self._file.write('\n')
+
+    @staticmethod
+    def completed(path: str, retry_failed: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Records already in the file by URL
+
+        With retry_failed, URLs whose latest record has no follower count are
+        left out (so they are tried again) unless the profile was not found.
+        """
+        records = {}
+        if not os.path.exists(path):
+            return records
+
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # partial line from an interrupted run
+                if retry_failed and record.get('followers') is None and record.get('error') != NOT_FOUND:
+                    records.pop(record.get('url'), None)
+                    continue
+                records[record['url']] = record
+        return records
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def username_from_url(url: str) -> str:
+    return urlparse(url).path.strip('/').split('/')[0]
+
+def fetch_followers_http(session: requests.Session, url: str, timeout: float = 10) -> Tuple[Optional[int], int]:
+    """Plain-HTTP attempt: (follower count or None, HTTP status)
+
+    Public profile pages usually carry the counts in their og:description
+    meta tag, which needs no JavaScript, so this avoids a browser entirely
+    whenever Instagram serves the page without a login wall.
+    """
+    response = session.get(url, timeout=timeout)
+    if response.status_code != 200:
+        return None, response.status_code
+    return extract_profile(response.text)['follower_count'], response.status_code
+
+class PooledScraper:
+    """Fetch follower counts for many profiles on a pool of workers
+
+    Each worker tries a plain HTTP request first and only falls back to a
+    browser when the page carries no counts. Browsers come from
+    browser_factory (anything with get_follower_count_public(url) and
+    close()), are created lazily, one per worker thread, and are closed at
+    the end of the run. All requests go through one HostRateLimiter.
+    """
+
+    def __init__(self, workers: int = 4, browser_factory: Optional[Callable[[], Any]] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None, http_first: bool = True,
+                 max_attempts: int = 3, timeout: float = 10):
+        self.workers = workers
+        self.browser_factory = browser_factory
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.http_first = http_first
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self._local = threading.local()
+        self._browsers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Finish the URLs in flight and skip the rest"""
+        self._stop.set()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(DESKTOP_HEADERS)
+        return session
+
+    def _browser(self):
+        browser = getattr(self._local, 'browser', None)
+        if browser is None:
+            browser = self._local.browser = self.browser_factory()
+            with self._lock:
+                self._browsers.append(browser)
+        return browser
+
+    def scrape(self, url: str) -> Dict[str, Any]:
+        """Fetch one profile's follower count, retrying throttled attempts"""
+        record = {'url': url, 'username': username_from_url(url), 'followers': None,
+                  'source': None, 'attempts': 0, 'error': None}
+        use_http = self.http_first
+
+        for attempt in range(1, self.max_attempts + 1):
+            if self._stop.is_set():
+                record['error'] = 'Stopped'
+                break
+            record['attempts'] = attempt
+
+            if use_http:
+                self.rate_limiter.acquire(url)
+                try:
+                    followers, status = fetch_followers_http(self._session(), url, self.timeout)
+                except requests.RequestException as e:
+                    record['error'] = str(e)
+                    self.rate_limiter.backoff(url)
+                    continue
+
+                if status in THROTTLE_STATUSES:
+                    record['error'] = f'HTTP {status}'
+                    self.rate_limiter.backoff(url)
+                    continue
+                if status == 404:
+                    record['error'] = NOT_FOUND
+                    break
+                if followers is not None:
+                    self.rate_limiter.success(url)
+                    record.update(followers=followers, source='http', error=None)
+                    break
+
+                # Page served without counts (login wall); the browser may still get them
+                use_http = False
+
+            if self.browser_factory is None:
+                record['error'] = 'No follower count in page'
+                break
+
+            self.rate_limiter.acquire(url)
+            try:
+                followers = self._browser().get_follower_count_public(url)
+            except Exception as e:
+                followers = None
+                record['error'] = str(e)
+
+            if followers is not None:
+                self.rate_limiter.success(url)
+                record.update(followers=followers, source='browser', error=None)
+                break
+
+            # An empty browser page is usually a soft block; back off before retrying
+            record['error'] = record['error'] or 'Follower count not found'
+            self.rate_limiter.backoff(url)
+
+        record['scraped_at'] = datetime.now().isoformat()
+        return record
+
+    def run(self, urls: Iterable[str], output_path: str, retry_failed: bool = True,
+            progress_every: int = 50) -> Dict[str, Any]:
+        """Scrape every URL not already in output_path, streaming results to it"""
+        urls = list(dict.fromkeys(urls))
+        done = ResultStream.completed(output_path, retry_failed=retry_failed)
+        pending = [url for url in urls if url not in done]
+
+        print(f"🔍 {len(pending)} to scrape, {len(urls) - len(pending)} already in '{output_path}'")
+
+        summary = {'scraped': 0, 'failed': 0, 'skipped': len(urls) - len(pending),
+                   'http': 0, 'browser': 0}
+        start = time.time()
+        self._stop.clear()
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='scrape-worker')
+        try:
+            with ResultStream(output_path) as stream:
+                futures = [executor.submit(self.scrape, url) for url in pending]
+                for i, future in enumerate(as_completed(futures), 1):
+                    record = future.result()
+                    if record['error'] == 'Stopped':
+                        continue
+                    stream.write(record)
+
+                    if record['followers'] is not None:
+                        summary['scraped'] += 1
+                        summary[record['source']] += 1
+                    else:
+                        summary['failed'] += 1
+
+                    if progress_every and i % progress_every == 0:
+                        rate = i / (time.time() - start)
+                        print(f"   {i}/{len(pending)} done ({rate:.1f}/s)")
+
+        except KeyboardInterrupt:
+            print("\n⏹️  Interrupted; finished results are saved and the next run resumes from them")
+            self._stop.set()
+            raise
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.close()
+
+        summary['elapsed'] = round(time.time() - start, 2)
+        print(f"✅ {summary['scraped']} scraped ({summary['http']} via HTTP, {summary['browser']} via browser), "
+              f"{summary['failed']} failed, {summary['skipped']} skipped in {summary['elapsed']}s")
+        return summary
+
+    def close(self):
+        """Quit every browser the workers started"""
+        with self._lock:
+            browsers, self._browsers = self._browsers, []
+        for browser in browsers:
+            try:
+                browser.close()
+            except Exception:
+                pass
+
+def read_urls(path: str):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pooled Instagram follower count scraper")
+    parser.add_argument('urls_file', help="File with one profile URL per line")
+    parser.add_argument('--output', default='follower_counts.jsonl', help="JSON Lines results file (resumed if it exists)")
+    parser.add_argument('--workers', type=int, default=4, help="Worker threads, each with at most one browser")
+    parser.add_argument('--min-interval', type=float, default=2.0, help="Minimum seconds between requests to one host")
+    parser.add_argument('--http-only', action='store_true', help="Never start a browser")
+    parser.add_argument('--no-http', action='store_true', help="Skip the plain HTTP attempt")
+    parser.add_argument('--show-browser', action='store_true', help="Run browsers with a visible window")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    browser_factory = None
+    if not args.http_only:
+        from insta_scrape import InstagramSeleniumScraper
+        browser_factory = lambda: InstagramSeleniumScraper(headless=not args.show_browser)
+
+    PooledScraper(
+        workers=args.workers,
+        browser_factory=browser_factory,
+        rate_limiter=HostRateLimiter(min_interval=args.min_interval),
+        http_first=not args.no_http
+    ).run(read_urls(args.urls_file), args.output)
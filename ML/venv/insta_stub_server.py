@@ -0,0 +1,143 @@
+# insta_stub_server.py
+import json
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Roughly the size of a real profile page, so parsing cost is realistic
+FILLER_SCRIPT = '<script>window.__filler = "' + 'x' * 200_000 + '";</script>'
+
+class StubInstagramServer:
+    """Local stand-in for Instagram profile pages and the JSON endpoint
+
+    Requests are classified as 'desktop', 'mobile' (by User-Agent) or 'json'
+    (the web_profile_info endpoint). Each kind can be given its own delay and
+    HTTP status, and can be told to leave the bio and counts out of its
+    response, which is enough to reproduce the slow, blocked and login-wall
+    cases offline. Usernames in `followers` get follower counts in their
+    og:description, usernames in `throttle` get that many 429 responses
+    before they are served, and usernames in `login_wall` get their desktop
+    page without bio or counts.
+    """
+
+    def __init__(self, bios=None, delays=None, statuses=None, hide_bio=(), port=0,
+                 followers=None, throttle=None, login_wall=()):
+        self.bios = dict(bios or {})
+        self.delays = dict(delays or {})
+        self.statuses = dict(statuses or {})
+        self.hide_bio = set(hide_bio)
+        self.followers = dict(followers or {})
+        self.throttle = dict(throttle or {})
+        self.login_wall = set(login_wall)
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @staticmethod
+    def classify(path, user_agent):
+        if path.startswith('/api/'):
+            return 'json'
+        if 'Mobile' in user_agent or 'iPhone' in user_agent or 'Android' in user_agent:
+            return 'mobile'
+        return 'desktop'
+
+    def render_page(self, username, bio, followers=None):
+        description = escape(bio, quote=True)
+        counts = ''
+        if followers is not None:
+            counts = (f'<meta property="og:description" content="{followers:,} Followers, 120 Following, '
+                      f'45 Posts - See Instagram photos and videos from {username} (@{username})">')
+        return (
+            f'<!DOCTYPE html><html><head><title>@{username} • Instagram</title>'
+            f'<meta name="description" content="{description}">{counts}'
+            f'{FILLER_SCRIPT}</head><body><main></main></body></html>'
+        )
+
+    def render_json(self, username, bio):
+        return json.dumps({'data': {'user': {'username': username, 'biography': bio}}})
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                kind = stub.classify(parsed.path, self.headers.get('User-Agent', ''))
+                stub.requests.append((kind, parsed.path, time.monotonic()))
+
+                time.sleep(stub.delays.get(kind, 0))
+
+                status = stub.statuses.get(kind, 200)
+                if kind == 'json':
+                    username = parse_qs(parsed.query).get('username', [''])[0]
+                else:
+                    username = parsed.path.strip('/').split('/')[0]
+
+                with stub._lock:
+                    if stub.throttle.get(username, 0) > 0:
+                        stub.throttle[username] -= 1
+                        status = 429
+
+                if status == 200 and username not in stub.bios and username not in stub.followers:
+                    status = 404
+
+                if status != 200:
+                    body, content_type = '', 'text/plain'
+                else:
+                    hidden = kind in stub.hide_bio or (kind == 'desktop' and username in stub.login_wall)
+                    bio = '' if hidden else stub.bios.get(username, '')
+                    followers = None if hidden else stub.followers.get(username)
+                    if kind == 'json':
+                        body, content_type = stub.render_json(username, bio), 'application/json'
+                    else:
+                        body, content_type = stub.render_page(username, bio, followers), 'text/html; charset=utf-8'
+
+                payload = body.encode('utf-8')
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', content_type)
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client cancelled the request (e.g. a losing race strategy)
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+if __name__ == "__main__":
+    with StubInstagramServer(bios={'nasa': 'Exploring the universe GV-123456'}, port=8765) as server:
+        print(f"🧪 Stub Instagram server running on {server.base_url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped")
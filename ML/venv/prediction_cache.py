@@ -0,0 +1,98 @@
+# prediction_cache.py
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+class PredictionCache:
+    """Bounded LRU cache with expiry that coalesces concurrent misses
+
+    The first caller to miss on a key computes the value; callers that miss
+    on the same key while it is running wait for that result instead of
+    computing it again. Exceptions are passed to every waiter and never
+    cached. clear() drops all entries, and values still being computed when
+    it is called are returned to their callers but not stored.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing it at most once"""
+        owner = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[key]
+
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.coalesced += 1
+            else:
+                pending = self._pending[key] = Future()
+                generation = self._generation
+                self.misses += 1
+                owner = True
+
+        if not owner:
+            return pending.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                self._release(key, pending)
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            self._release(key, pending)
+            if generation == self._generation:
+                self._entries[key] = (value, time.monotonic() + self.ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        pending.set_result(value)
+        return value
+
+    def _release(self, key, pending):
+        # After a clear() a newer computation may own the key; leave it alone
+        if self._pending.get(key) is pending:
+            del self._pending[key]
+
+    def clear(self):
+        """Invalidate every entry, e.g. after a new model is loaded"""
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+            self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'hit_rate': round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,537 @@
+# verification_jobs.py
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+from goviral_metrics import start_profile, stop_profile
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+def is_stale(job: Dict[str, Any], lease: float, now: Optional[float] = None) -> bool:
+    """True for an active job whose owner has not touched it within lease seconds"""
+    now = time.time() if now is None else now
+    return job['status'] in ACTIVE_STATUSES and job['updated_at'] <= now - lease
+
+def abandoned(job: Dict[str, Any], now: float) -> Dict[str, Any]:
+    """Failed copy of a job whose worker died or was redeployed mid-check"""
+    return dict(
+        job, status='failed', updated_at=now,
+        result={'verified': False, 'message': 'Verification check was interrupted. Please check again.'}
+    )
+
+class VerificationStore(ABC):
+    """Storage for issued tokens, verification jobs and cached bio lookups
+
+    Tokens and cached lookups carry an absolute expiry time (time.time()).
+    Jobs are plain dicts so both backends can round-trip them unchanged.
+    The process running a job touches it regularly; an active job not
+    touched within `lease` seconds is treated as abandoned and marked failed.
+    """
+
+    @abstractmethod
+    def issue_token(self, username: str, token: str, expires_at: float):
+        pass
+
+    @abstractmethod
+    def get_token(self, username: str) -> Optional[str]:
+        """Return the unexpired token issued to username, if any"""
+
+    @abstractmethod
+    def save_job(self, job: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def find_active_job(self, username: str, token: str, lease: float) -> Optional[Dict[str, Any]]:
+        """Return a queued or running job checking `token` for username, if any
+
+        Abandoned active jobs are marked failed instead of being returned.
+        """
+
+    @abstractmethod
+    def claim_job(self, job: Dict[str, Any], lease: float) -> Tuple[Dict[str, Any], bool]:
+        """Save a new active job unless one with the same username and token exists
+
+        Returns (the job to follow, whether it is the one just saved). The
+        check and the insert are atomic across every user of the store.
+        """
+
+    @abstractmethod
+    def touch_jobs(self, job_ids: List[str], now: float):
+        """Renew the lease of the given jobs that are still active"""
+
+    @abstractmethod
+    def cache_found_token(self, username: str, found_token: str, expires_at: float):
+        pass
+
+    @abstractmethod
+    def get_cached_token(self, username: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def purge_expired(self, job_ttl: float, lease: float):
+        """Drop expired tokens and cache entries, and jobs older than job_ttl
+
+        Abandoned active jobs are marked failed, and dropped once that is
+        older than job_ttl.
+        """
+
+class InMemoryVerificationStore(VerificationStore):
+    """Single-process store backed by dicts and an LRU for cached lookups"""
+
+    def __init__(self, max_cache_entries: int = 10000):
+        self.max_cache_entries = max_cache_entries
+        self._tokens = {}
+        self._jobs = {}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def issue_token(self, username, token, expires_at):
+        with self._lock:
+            self._tokens[username] = (token, expires_at)
+
+    def get_token(self, username):
+        with self._lock:
+            entry = self._tokens.get(username)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._tokens[username]
+                return None
+            return entry[0]
+
+    def save_job(self, job):
+        with self._lock:
+            self._jobs[job['job_id']] = dict(job)
+
+    def get_job(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def find_active_job(self, username, token, lease):
+        with self._lock:
+            return self._find_active_job(username, token, lease, time.time())
+
+    def _find_active_job(self, username, token, lease, now):
+        for job_id, job in self._jobs.items():
+            if (job['username'] != username or job['verification_token'] != token
+                    or job['status'] not in ACTIVE_STATUSES):
+                continue
+            if is_stale(job, lease, now):
+                self._jobs[job_id] = abandoned(job, now)
+                continue
+            return dict(job)
+        return None
+
+    def claim_job(self, job, lease):
+        with self._lock:
+            active = self._find_active_job(job['username'], job['verification_token'], lease, time.time())
+            if active:
+                return active, False
+            self._jobs[job['job_id']] = dict(job)
+            return dict(job), True
+
+    def touch_jobs(self, job_ids, now):
+        with self._lock:
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if job and job['status'] in ACTIVE_STATUSES:
+                    job['updated_at'] = now
+
+    def cache_found_token(self, username, found_token, expires_at):
+        with self._lock:
+            self._cache[username] = (found_token, expires_at)
+            self._cache.move_to_end(username)
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+
+    def get_cached_token(self, username):
+        with self._lock:
+            entry = self._cache.get(username)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._cache[username]
+                return None
+            self._cache.move_to_end(username)
+            return entry[0]
+
+    def purge_expired(self, job_ttl, lease):
+        now = time.time()
+        with self._lock:
+            for job_id, job in self._jobs.items():
+                if is_stale(job, lease, now):
+                    self._jobs[job_id] = abandoned(job, now)
+            self._tokens = {u: e for u, e in self._tokens.items() if e[1] > now}
+            for username in [u for u, e in self._cache.items() if e[1] <= now]:
+                del self._cache[username]
+            self._jobs = {
+                job_id: job for job_id, job in self._jobs.items()
+                if job['status'] in ACTIVE_STATUSES or job['updated_at'] > now - job_ttl
+            }
+
+class SQLiteVerificationStore(VerificationStore):
+    """Store backed by a local SQLite file, shared by all workers on one node"""
+
+    def __init__(self, path: str = 'goviral_verification.db', max_cache_entries: int = 10000):
+        self.path = path
+        self.max_cache_entries = max_cache_entries
+        conn = self._connect()
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tokens (
+                    username TEXT PRIMARY KEY,
+                    token TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    username TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS jobs_username ON jobs (username, status);
+                CREATE TABLE IF NOT EXISTS bio_cache (
+                    username TEXT PRIMARY KEY,
+                    found_token TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                );
+            """)
+        finally:
+            conn.close()
+
+    def _connect(self, **kwargs):
+        # One short-lived connection per call keeps this safe across threads and processes
+        return sqlite3.connect(self.path, timeout=10, **kwargs)
+
+    def _query_one(self, sql, params):
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchone()
+        finally:
+            conn.close()
+
+    def _execute(self, sql, params=()):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(sql, params)
+        finally:
+            conn.close()
+
+    def issue_token(self, username, token, expires_at):
+        self._execute(
+            'INSERT OR REPLACE INTO tokens (username, token, expires_at) VALUES (?, ?, ?)',
+            (username, token, expires_at)
+        )
+
+    def get_token(self, username):
+        row = self._query_one(
+            'SELECT token FROM tokens WHERE username = ? AND expires_at > ?',
+            (username, time.time())
+        )
+        return row[0] if row else None
+
+    def save_job(self, job):
+        self._execute(
+            'INSERT OR REPLACE INTO jobs (job_id, username, status, updated_at, data) VALUES (?, ?, ?, ?, ?)',
+            (job['job_id'], job['username'], job['status'], job['updated_at'], json.dumps(job))
+        )
+
+    def get_job(self, job_id):
+        row = self._query_one('SELECT data FROM jobs WHERE job_id = ?', (job_id,))
+        return json.loads(row[0]) if row else None
+
+    def _fail_stale_jobs(self, conn, lease, now, username=None):
+        sql = 'SELECT data FROM jobs WHERE status IN (?, ?) AND updated_at <= ?'
+        params = (*ACTIVE_STATUSES, now - lease)
+        if username is not None:
+            sql += ' AND username = ?'
+            params += (username,)
+
+        for (data,) in conn.execute(sql, params).fetchall():
+            job = abandoned(json.loads(data), now)
+            conn.execute(
+                'UPDATE jobs SET status = ?, updated_at = ?, data = ? WHERE job_id = ?',
+                (job['status'], job['updated_at'], json.dumps(job), job['job_id'])
+            )
+
+    def _find_active_job(self, conn, username, token, lease):
+        self._fail_stale_jobs(conn, lease, time.time(), username)
+        rows = conn.execute(
+            'SELECT data FROM jobs WHERE username = ? AND status IN (?, ?) ORDER BY updated_at DESC',
+            (username, *ACTIVE_STATUSES)
+        ).fetchall()
+        for (data,) in rows:
+            job = json.loads(data)
+            if job['verification_token'] == token:
+                return job
+        return None
+
+    def find_active_job(self, username, token, lease):
+        conn = self._connect()
+        try:
+            with conn:
+                return self._find_active_job(conn, username, token, lease)
+        finally:
+            conn.close()
+
+    def claim_job(self, job, lease):
+        # BEGIN IMMEDIATE takes the write lock before the check, so two
+        # workers cannot both see no active job and both insert one
+        conn = self._connect(isolation_level=None)
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                active = self._find_active_job(conn, job['username'], job['verification_token'], lease)
+                if active is None:
+                    conn.execute(
+                        'INSERT INTO jobs (job_id, username, status, updated_at, data) VALUES (?, ?, ?, ?, ?)',
+                        (job['job_id'], job['username'], job['status'], job['updated_at'], json.dumps(job))
+                    )
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        finally:
+            conn.close()
+
+        if active is not None:
+            return active, False
+        return dict(job), True
+
+    def touch_jobs(self, job_ids, now):
+        if not job_ids:
+            return
+        placeholders = ', '.join('?' * len(job_ids))
+        # One statement, so a concurrent save_job of a new status is never overwritten
+        self._execute(
+            f"UPDATE jobs SET updated_at = ?, data = json_set(data, '$.updated_at', ?) "
+            f"WHERE status IN (?, ?) AND job_id IN ({placeholders})",
+            (now, now, *ACTIVE_STATUSES, *job_ids)
+        )
+
+    def cache_found_token(self, username, found_token, expires_at):
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO bio_cache (username, found_token, expires_at, last_used) VALUES (?, ?, ?, ?)',
+                    (username, found_token, expires_at, now)
+                )
+                conn.execute(
+                    'DELETE FROM bio_cache WHERE username IN ('
+                    'SELECT username FROM bio_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                    (self.max_cache_entries,)
+                )
+        finally:
+            conn.close()
+
+    def get_cached_token(self, username):
+        now = time.time()
+        row = self._query_one(
+            'SELECT found_token FROM bio_cache WHERE username = ? AND expires_at > ?',
+            (username, now)
+        )
+        if row is None:
+            return None
+        self._execute('UPDATE bio_cache SET last_used = ? WHERE username = ?', (now, username))
+        return row[0]
+
+    def purge_expired(self, job_ttl, lease):
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                self._fail_stale_jobs(conn, lease, now)
+                conn.execute('DELETE FROM tokens WHERE expires_at <= ?', (now,))
+                conn.execute('DELETE FROM bio_cache WHERE expires_at <= ?', (now,))
+                conn.execute(
+                    'DELETE FROM jobs WHERE status NOT IN (?, ?) AND updated_at <= ?',
+                    (*ACTIVE_STATUSES, now - job_ttl)
+                )
+        finally:
+            conn.close()
+
+def create_store(backend: str = 'memory', path: str = 'goviral_verification.db') -> VerificationStore:
+    """Build a verification store by backend name ('memory' or 'sqlite')"""
+    if backend == 'memory':
+        return InMemoryVerificationStore()
+    if backend == 'sqlite':
+        return SQLiteVerificationStore(path)
+    raise ValueError(f"Unknown verification store backend: {backend}")
+
+class VerificationJobManager:
+    """Run Instagram verification checks on a worker pool
+
+    Tokens issued by start_verification are stored with an expiry and every
+    check is matched against them. Concurrent checks for the same username
+    share one job, and tokens found in a bio are cached for cache_ttl
+    seconds so repeat checks within that window skip the scrape entirely.
+    A heartbeat thread renews the lease of every job this process holds,
+    queued or running, so an active job not renewed for job_lease seconds
+    belongs to a worker that died and is reported as failed.
+    """
+
+    def __init__(self, verifier, store: VerificationStore, max_workers: int = 4,
+                 token_ttl: float = 900, cache_ttl: float = 300, job_ttl: float = 3600,
+                 job_lease: float = 60):
+        self.verifier = verifier
+        self.store = store
+        self.token_ttl = token_ttl
+        self.cache_ttl = cache_ttl
+        self.job_ttl = job_ttl
+        self.job_lease = job_lease
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='verify-job')
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._last_purge = time.time()
+        self._closed = threading.Event()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat, name='verify-heartbeat', daemon=True)
+        self._heartbeat_thread.start()
+
+    def start_verification(self, username: str) -> str:
+        """Issue and store a new token for username"""
+        clean_username = self.verifier.clean_username(username)
+        token = self.verifier.generate_verification_token()
+        self.store.issue_token(clean_username, token, time.time() + self.token_ttl)
+        return token
+
+    def submit(self, username: str, token: str) -> Dict[str, Any]:
+        """Queue a verification check, or join the one already running
+
+        Raises ValueError if no unexpired token was issued for username or
+        the given token does not match it.
+        """
+        clean_username = self.verifier.clean_username(username)
+        expected_token = self.store.get_token(clean_username)
+        if expected_token is None:
+            raise ValueError('No active verification token for this username. Please start verification again.')
+        if expected_token.upper() != token.strip().upper():
+            raise ValueError('Verification token does not match the one issued for this username.')
+
+        self._maybe_purge()
+
+        with self._lock:
+            job = self._local_active_job(clean_username, expected_token)
+            if job is None:
+                job = self.store.find_active_job(clean_username, expected_token, self.job_lease)
+            if job:
+                return job
+
+            now = time.time()
+            job = {
+                'job_id': uuid.uuid4().hex,
+                'username': clean_username,
+                'verification_token': expected_token,
+                'status': 'queued',
+                'result': None,
+                'created_at': now,
+                'updated_at': now,
+            }
+
+            cached_token = self.store.get_cached_token(clean_username)
+            if cached_token and cached_token.upper() == expected_token.upper():
+                job['status'] = 'done'
+                job['result'] = self.verifier.build_verification_result(
+                    clean_username, expected_token, cached_token, 0.0, cached=True
+                )
+                self.store.save_job(job)
+                return job
+
+            job, created = self.store.claim_job(job, self.job_lease)
+            if created:
+                self._futures[job['job_id']] = self.executor.submit(self._run, job)
+            return job
+
+    def _local_active_job(self, username, token):
+        # Jobs this process still holds are never abandoned, whatever the store says
+        for job_id in self._futures:
+            job = self.store.get_job(job_id)
+            if job and job['username'] == username and job['verification_token'] == token:
+                return job
+        return None
+
+    def _heartbeat(self):
+        interval = self.job_lease / 3
+        while not self._closed.wait(interval):
+            with self._lock:
+                job_ids = list(self._futures)
+            try:
+                self.store.touch_jobs(job_ids, time.time())
+            except Exception:
+                pass  # a missed beat is retried next interval, well inside the lease
+
+    def _run(self, job: Dict[str, Any]):
+        job = dict(job, status='running', updated_at=time.time())
+        self.store.save_job(job)
+
+        # The job's stage timings travel with it, for whichever request waits on it
+        profile_token = start_profile()
+        try:
+            job['result'] = self.verifier.verify_user(job['username'], job['verification_token'])
+            found_token = job['result'].get('found_token')
+            if found_token:
+                self.store.cache_found_token(job['username'], found_token, time.time() + self.cache_ttl)
+            job['status'] = 'done'
+
+        except Exception as e:
+            job['status'] = 'failed'
+            job['result'] = {'verified': False, 'message': f'Verification check failed: {str(e)}'}
+
+        finally:
+            job['stages'] = stop_profile(profile_token)
+            job['updated_at'] = time.time()
+            self.store.save_job(job)
+            with self._lock:
+                self._futures.pop(job['job_id'], None)
+
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.store.get_job(job_id)
+        if job and job_id not in self._futures and is_stale(job, self.job_lease):
+            return abandoned(job, time.time())
+        return job
+
+    def wait(self, job: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until job finishes (or timeout) and return its latest state"""
+        with self._lock:
+            future = self._futures.get(job['job_id'])
+
+        if future is not None:
+            try:
+                future.result(timeout=timeout)
+            except FutureTimeoutError:
+                pass
+        else:
+            # Job owned by another process; poll the shared store
+            deadline = time.time() + (timeout if timeout is not None else float('inf'))
+            while job['status'] in ACTIVE_STATUSES and time.time() < deadline:
+                time.sleep(0.2)
+                job = self.get_job(job['job_id']) or job
+
+        return self.get_job(job['job_id']) or job
+
+    def close(self):
+        """Stop the heartbeat and wait for running jobs to finish"""
+        self._closed.set()
+        self.executor.shutdown(wait=True)
+
+    def _maybe_purge(self):
+        if time.time() - self._last_purge > 60:
+            self._last_purge = time.time()
+            self.store.purge_expired(self.job_ttl, self.job_lease)